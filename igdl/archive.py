@@ -4,7 +4,13 @@ Similar to yt-dlp's --download-archive feature.
 Format: one shortcode per line.
 """
 
+import atexit
+import os
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
+from typing import BinaryIO
 
 
 class DownloadArchive:
@@ -15,8 +21,19 @@ class DownloadArchive:
         ABC123def
         XYZ789ghi
         ...
+
+    Shortcodes are ASCII, so they are kept as bytes in memory: the file
+    loads without decoding and each entry is smaller than a str.
+
+    Writes go through a single buffered append handle that stays open
+    for the archive lifetime. Call flush() at batch boundaries to persist.
+    add_many_in_background() hands the write and fsync to a single writer
+    thread instead; new entries are visible to contains() immediately.
     """
 
+    # Write buffer size for the append handle (128 KiB)
+    BUFFER_SIZE: int = 1 << 17
+
     def __init__(self, path: Path | str | None) -> None:
         """Initialize archive.
 
@@ -24,40 +41,130 @@ class DownloadArchive:
             path: Path to archive file. If None, archive is disabled.
         """
         self._path = Path(path) if path else None
-        self._downloaded: set[str] = set()
+        self._downloaded: set[bytes] = set()
+        self._fp: BinaryIO | None = None
+        # _lock guards _downloaded; _io_lock guards the append handle, so a
+        # background fsync never blocks contains()
+        self._lock = Lock()
+        self._io_lock = Lock()
+        self._writer: ThreadPoolExecutor | None = None
+        # Writes run in submission order, so the last one finishing means all did
+        self._last_write: Future[None] | None = None
         self._load()
 
     def _load(self) -> None:
         """Load existing archive from file."""
-        if not self._path or not self._path.exists():
+        if not self._path:
+            return
+
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
             return
 
-        with self._path.open("r", encoding="utf-8") as f:
-            for line in f:
-                shortcode = line.strip()
-                if shortcode:
-                    self._downloaded.add(shortcode)
+        # Single read + C-level split, no decode needed
+        self._downloaded = set(data.splitlines())
+        self._downloaded.discard(b"")
 
     def contains(self, shortcode: str) -> bool:
         """Check if shortcode is in archive."""
-        return shortcode in self._downloaded
+        key = shortcode.encode()
+        with self._lock:
+            return key in self._downloaded
+
+    def _open(self, path: Path) -> BinaryIO:
+        """Open the append handle on first write."""
+        if self._fp is None:
+            # Ensure parent directory exists
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._fp = path.open("ab", buffering=self.BUFFER_SIZE)
+            atexit.register(self.close)
+        return self._fp
+
+    def snapshot(self) -> frozenset[bytes]:
+        """Get an immutable copy of archived shortcodes for hot membership scans.
+
+        The copy shares the stored bytes objects instead of decoding them, so
+        it only costs a hash table rather than a second set of strings.
+        Callers check membership with ``shortcode.encode() in snapshot``.
+        """
+        with self._lock:
+            return frozenset(self._downloaded)
+
+    def _claim(self, shortcodes: Iterable[str]) -> list[bytes]:
+        """Record shortcodes in memory, returning the keys that were new."""
+        keys = dict.fromkeys(sc.encode() for sc in shortcodes)
+        with self._lock:
+            new = [key for key in keys if key not in self._downloaded]
+            self._downloaded.update(new)
+        return new
+
+    def _write(self, keys: list[bytes], sync: bool = False) -> None:
+        """Append keys to the archive file, optionally flushing and fsyncing it."""
+        if not self._path:
+            return
+        with self._io_lock:
+            fp = self._open(self._path)
+            fp.writelines(key + b"\n" for key in keys)
+            if sync:
+                fp.flush()
+                os.fsync(fp.fileno())
 
     def add(self, shortcode: str) -> None:
         """Add shortcode to archive.
 
-        Writes immediately to file for crash-safety.
+        The write is buffered; call flush() to persist it to disk.
         """
-        if shortcode in self._downloaded:
-            return
+        self.add_many((shortcode,))
 
-        self._downloaded.add(shortcode)
+    def add_many(self, shortcodes: Iterable[str]) -> None:
+        """Add several shortcodes to archive with a single buffered write."""
+        new = self._claim(shortcodes)
+        if new:
+            self._write(new)
 
-        if self._path:
-            # Ensure parent directory exists
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            # Append to file immediately (crash-safe)
-            with self._path.open("a", encoding="utf-8") as f:
-                f.write(f"{shortcode}\n")
+    def add_many_in_background(self, shortcodes: Iterable[str]) -> None:
+        """Add shortcodes now, writing and fsyncing them on the writer thread.
+
+        contains() and snapshot() see the new entries immediately; call
+        flush() to wait until they are on disk.
+        """
+        new = self._claim(shortcodes)
+        if not new or not self._path:
+            return
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="igdl-archive")
+        self._last_write = self._writer.submit(self._write, new, True)
+
+    def flush(self) -> None:
+        """Wait for background writes, then flush and fsync the archive file."""
+        last_write, self._last_write = self._last_write, None
+        if last_write is not None:
+            last_write.result()
+        with self._io_lock:
+            if self._fp:
+                self._fp.flush()
+                os.fsync(self._fp.fileno())
+
+    def close(self) -> None:
+        """Flush and close the archive file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.shutdown()
+            self._writer = None
+        with self._io_lock:
+            if self._fp:
+                self._fp.close()
+                self._fp = None
+                atexit.unregister(self.close)
+
+    def __enter__(self) -> "DownloadArchive":
+        """Use the archive as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Flush and close the archive file."""
+        self.close()
 
     def __len__(self) -> int:
         """Return number of archived shortcodes."""
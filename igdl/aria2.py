@@ -1,22 +1,43 @@
 """Aria2c batch downloader for CDN media."""
 
+import os
 import shutil
 import subprocess
+from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 from rich.console import Console
 
 console = Console()
 
+# Seconds to wait for aria2c to exit after terminate() before killing it
+TERMINATE_TIMEOUT = 5.0
 
-@dataclass
+# Input file comment (ignored by aria2c) carrying each entry's archive key
+SHORTCODE_COMMENT = "# shortcode="
+
+
+@cache
+def _find_aria2c() -> str | None:
+    """Locate the aria2c binary on PATH (looked up once per process).
+
+    Call _find_aria2c.cache_clear() after changing PATH to look again.
+    """
+    return shutil.which("aria2c")
+
+
+@dataclass(slots=True, frozen=True)
 class DownloadItem:
     """Single item to download."""
 
     url: str
     filename: str
     shortcode: str
+    # Per-item target directory (aria2c "dir" option); None means output_dir
+    directory: Path | None = None
 
 
 @dataclass
@@ -24,54 +45,111 @@ class Aria2Downloader:
     """Batch downloader using aria2c.
 
     Downloads in chunks to avoid URL expiration.
-    Saves URL list to file for crash recovery.
+    Saves URL list to file for crash recovery. Items may target their own
+    directories, so one aria2c run can serve several output folders.
     """
 
     output_dir: Path
     quiet: bool = False
-    max_connections: int = 4
-    max_concurrent: int = 16
+    # Many small files: parallelize across items (-j), not within an item (-x)
+    max_connections: int = 1
+    max_concurrent: int = 32
+    split: int = 1
+    min_split_size: str = "1M"
+    file_allocation: str = "none"
+    # Optional check (e.g. archive.contains) for shortcodes that need no download
+    skip_predicate: Callable[[str], bool] | None = None
     _items: list[DownloadItem] = field(default_factory=list)
+    _shortcodes: set[str] = field(default_factory=set)
+    _seen: set[tuple[str, str]] = field(default_factory=set)
     _input_file: Path | None = None
+    _aria2c_path: str = field(default="aria2c", init=False)
+
+    def __post_init__(self) -> None:
+        self._aria2c_path = _find_aria2c() or "aria2c"
 
     @staticmethod
     def is_available() -> bool:
         """Check if aria2c is installed."""
-        return shutil.which("aria2c") is not None
+        return _find_aria2c() is not None
+
+    def add(self, url: str, filename: str, shortcode: str, directory: Path | None = None) -> bool:
+        """Add item to download queue.
 
-    def add(self, url: str, filename: str, shortcode: str) -> None:
-        """Add item to download queue."""
-        self._items.append(DownloadItem(url=url, filename=filename, shortcode=shortcode))
+        Args:
+            url: Media URL
+            filename: Output file name
+            shortcode: Archive key reported back on success
+            directory: Target directory (defaults to output_dir)
+
+        Returns:
+            True if the item was queued, False if it was already queued
+            or skip_predicate matched its shortcode
+        """
+        if self.skip_predicate and self.skip_predicate(shortcode):
+            return False
+        key = (shortcode, filename)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._items.append(
+            DownloadItem(url=url, filename=filename, shortcode=shortcode, directory=directory)
+        )
+        self._shortcodes.add(shortcode)
+        return True
 
     def clear(self) -> None:
         """Clear download queue."""
         self._items.clear()
+        self._shortcodes.clear()
+        self._seen.clear()
 
     def __len__(self) -> int:
         """Return number of items in queue."""
         return len(self._items)
 
     @property
-    def shortcodes(self) -> set[str]:
-        """Get unique shortcodes in queue."""
-        return {item.shortcode for item in self._items}
+    def shortcodes(self) -> AbstractSet[str]:
+        """Get unique shortcodes in queue (maintained incrementally, do not mutate)."""
+        return self._shortcodes
 
     def _write_input_file(self, path: Path) -> None:
         """Write aria2c input file.
 
+        Each entry is preceded by a comment (ignored by aria2c) carrying its
+        archive key, so resume() can restore it without parsing filenames.
+
         Format:
+            # shortcode=ABC
             https://url1
               out=filename1.jpg
+            # shortcode=XYZ
             https://url2
+              dir=/path/to/subdir
               out=filename2.mp4
         """
-        lines: list[str] = []
-        for item in self._items:
-            lines.append(item.url)
-            lines.append(f"  out={item.filename}")
-
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # Write to a temp file and atomically swap it in, so a crash mid-write
+        # never leaves a truncated resume file behind
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        try:
+            # Stream entries through a 1 MiB buffer instead of joining one big string
+            with tmp.open("w", encoding="utf-8", buffering=1 << 20) as f:
+                for item in self._items:
+                    f.write(SHORTCODE_COMMENT)
+                    f.write(item.shortcode)
+                    f.write("\n")
+                    f.write(item.url)
+                    if item.directory is not None:
+                        f.write("\n  dir=")
+                        f.write(str(item.directory))
+                    f.write("\n  out=")
+                    f.write(item.filename)
+                    f.write("\n")
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
         self._input_file = path
 
     def _cleanup_input_file(self) -> None:
@@ -80,6 +158,31 @@ class Aria2Downloader:
             self._input_file.unlink()
             self._input_file = None
 
+    @staticmethod
+    def _existing_filenames(directory: Path) -> set[str]:
+        """Get names of files already present in directory.
+
+        One directory scan instead of a stat() call per queued item.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    def _downloaded_items(self) -> list[DownloadItem]:
+        """Get queued items whose files exist, scanning each target directory once."""
+        listings: dict[Path, set[str]] = {}
+        downloaded: list[DownloadItem] = []
+        for item in self._items:
+            directory = item.directory or self.output_dir
+            names = listings.get(directory)
+            if names is None:
+                names = listings[directory] = self._existing_filenames(directory)
+            if item.filename in names:
+                downloaded.append(item)
+        return downloaded
+
     def _run_aria2c(self, input_file: Path) -> tuple[int, int]:
         """Run aria2c with input file.
 
@@ -87,11 +190,18 @@ class Aria2Downloader:
             Tuple of (successful_count, failed_count)
         """
         cmd = [
-            "aria2c",
+            self._aria2c_path,
             f"--input-file={input_file}",
             f"--dir={self.output_dir}",
             f"--max-connection-per-server={self.max_connections}",
             f"--max-concurrent-downloads={self.max_concurrent}",
+            f"--split={self.split}",
+            f"--min-split-size={self.min_split_size}",
+            f"--file-allocation={self.file_allocation}",
+            "--piece-length=1M",
+            "--optimize-concurrent-downloads=true",
+            "--disk-cache=64M",
+            "--http-accept-gzip=true",
             "--continue=true",
             "--auto-file-renaming=false",
             "--allow-overwrite=false",
@@ -102,22 +212,44 @@ class Aria2Downloader:
         if self.quiet:
             cmd.append("--quiet=true")
         else:
-            cmd.append("--console-log-level=warn")
+            # Output is relayed line by line, so drop the in-place readout
+            cmd.extend(["--console-log-level=warn", "--show-console-readout=false"])
 
         try:
-            result = subprocess.run(
+            # Relay output through the console instead of letting aria2c write
+            # to the terminal directly, which would tear through a live
+            # progress display (batches run on a worker thread)
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL if self.quiet else subprocess.PIPE,
+                stderr=subprocess.DEVNULL if self.quiet else subprocess.STDOUT,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
             )
-
-            if result.returncode == 0:
+            try:
+                if proc.stdout is not None:
+                    with proc.stdout:
+                        for line in proc.stdout:
+                            line = line.rstrip()
+                            if line:
+                                console.print(line, markup=False, highlight=False)
+                returncode = proc.wait()
+            except BaseException:
+                # Don't leave aria2c writing into the output dir without an owner
+                proc.terminate()
+                try:
+                    proc.wait(timeout=TERMINATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                raise
+
+            if returncode == 0:
                 return len(self._items), 0
             else:
                 # Count existing files to determine success
-                successful = sum(
-                    1 for item in self._items if (self.output_dir / item.filename).exists()
-                )
+                successful = len(self._downloaded_items())
                 return successful, len(self._items) - successful
 
         except FileNotFoundError:
@@ -146,10 +278,7 @@ class Aria2Downloader:
         successful, failed = self._run_aria2c(input_file)
 
         # Determine which shortcodes succeeded
-        successful_shortcodes: set[str] = set()
-        for item in self._items:
-            if (self.output_dir / item.filename).exists():
-                successful_shortcodes.add(item.shortcode)
+        successful_shortcodes = {item.shortcode for item in self._downloaded_items()}
 
         if failed == 0:
             self._cleanup_input_file()
@@ -179,26 +308,45 @@ class Aria2Downloader:
             console.print("[cyan]Found incomplete download, resuming...[/cyan]")
 
         # Parse input file to reconstruct items
-        self._items.clear()
+        self.clear()
         content = input_file.read_text(encoding="utf-8")
-        lines = content.splitlines()
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if line.startswith("http"):
-                url = line
-                filename = ""
-                # Look for out= on next line
-                if i + 1 < len(lines) and "out=" in lines[i + 1]:
-                    filename = lines[i + 1].strip().replace("out=", "")
-                    i += 1
-                # Extract shortcode from filename (before first . or _)
-                shortcode = filename.split(".")[0].split("_")[0]
-                self._items.append(DownloadItem(url=url, filename=filename, shortcode=shortcode))
-            i += 1
 
+        # Entries are URL lines, each preceded by a shortcode comment and
+        # followed by indented "key=value" option lines
+        entries: list[tuple[str, str | None, dict[str, str]]] = []
+        shortcode: str | None = None
+        for line in content.splitlines():
+            if not line:
+                continue
+            if line.startswith("#"):
+                if line.startswith(SHORTCODE_COMMENT):
+                    shortcode = line[len(SHORTCODE_COMMENT) :].strip()
+            elif line.startswith((" ", "\t")):
+                if entries:
+                    key, _, value = line.strip().partition("=")
+                    entries[-1][2][key] = value
+            else:
+                entries.append((line.strip(), shortcode, {}))
+                shortcode = None
+
+        for url, shortcode, options in entries:
+            filename = options.get("out", "")
+            directory = options.get("dir")
+            self.add(
+                url=url,
+                filename=filename,
+                # Files written before shortcode comments: fall back to the name
+                shortcode=shortcode or filename.rsplit(".", 1)[0],
+                directory=Path(directory) if directory else None,
+            )
+
+        # Rewrite the file from the filtered queue, so aria2c doesn't fetch
+        # archived or duplicate entries and counts match what actually runs
         self._input_file = input_file
+        if not self._items:
+            self._cleanup_input_file()
+            return 0, 0
+        self._write_input_file(input_file)
         successful, failed = self._run_aria2c(input_file)
 
         if failed == 0:
@@ -2,6 +2,10 @@
 
 import random
 import time
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from threading import Lock
 
 from rich.console import Console
 
@@ -15,19 +19,18 @@ class BehaviorSimulator:
     to avoid detection by Instagram's anti-bot systems.
     """
 
-    # Page scrolling delay (between API pages of 12 posts)
-    PAGE_DELAY_MIN: float = 1.0
-    PAGE_DELAY_MAX: float = 3.0
-
     # Carousel swipe delay (between media items in a post)
     CAROUSEL_DELAY_MIN: float = 0.2
     CAROUSEL_DELAY_MAX: float = 0.5
 
-    # Periodic break settings
-    BREAK_POSTS_MIN: int = 50
-    BREAK_POSTS_MAX: int = 80
-    BREAK_DURATION_MIN: float = 10.0
-    BREAK_DURATION_MAX: float = 30.0
+    # Page scroll jitter, applied on top of bucket pacing
+    PAGE_DELAY_MIN: float = 1.0
+    PAGE_DELAY_MAX: float = 3.0
+
+    # Pacing token bucket: one token per page and per post, ~0.33s each.
+    # Small capacity and an empty start, so there is no initial burst.
+    BUCKET_CAPACITY: float = 3.0
+    BUCKET_REFILL_RATE: float = 3.0  # tokens per second
 
     # Highlight viewing delays (simulates tapping through highlights)
     HIGHLIGHT_TRAY_DELAY_MIN: float = 1.5
@@ -39,66 +42,103 @@ class BehaviorSimulator:
     AGGRESSIVE_PAGE_DELAY: float = 0.1
     AGGRESSIVE_CAROUSEL_DELAY: float = 0.05
 
+    # Number of delays pre-generated per (min, max) range
+    UNIFORM_BATCH_SIZE: int = 256
+
     def __init__(self, quiet: bool = False, has_proxy: bool = False) -> None:
         self._quiet = quiet
         self._has_proxy = has_proxy
-        self._posts_since_break = 0
-        self._next_break_at = self._random_break_interval()
-
-    def _random_break_interval(self) -> int:
-        """Generate random number of posts before next break."""
-        return random.randint(self.BREAK_POSTS_MIN, self.BREAK_POSTS_MAX)
-
-    def page_delay(self) -> None:
-        """Delay between API page fetches (simulates scrolling)."""
-        if self._has_proxy:
-            time.sleep(self.AGGRESSIVE_PAGE_DELAY)
+        self._rng = random.Random()
+        self._uniform_cache: dict[tuple[float, float], deque[float]] = {}
+        self._tokens = 0.0
+        self._bucket_lock = Lock()
+        self._last_refill = time.monotonic()
+
+        # Resolve proxy vs. no-proxy delays once: the public delay callables
+        # are bound directly to the chosen implementation.
+        # page_delay: between API page fetches (simulates scrolling)
+        # carousel_delay: between carousel items (simulates swiping)
+        # highlight_tray_delay: before fetching the highlights tray
+        # highlight_switch_delay: between viewing different highlights
+        self.page_delay: Callable[[], None]
+        self.carousel_delay: Callable[[], None]
+        self.highlight_tray_delay: Callable[[], None]
+        self.highlight_switch_delay: Callable[[], None]
+        if has_proxy:
+            self.page_delay = partial(time.sleep, self.AGGRESSIVE_PAGE_DELAY)
+            self.carousel_delay = partial(time.sleep, self.AGGRESSIVE_CAROUSEL_DELAY)
+            self.highlight_tray_delay = partial(time.sleep, self.AGGRESSIVE_PAGE_DELAY)
+            self.highlight_switch_delay = partial(time.sleep, self.AGGRESSIVE_PAGE_DELAY)
         else:
-            delay = random.uniform(self.PAGE_DELAY_MIN, self.PAGE_DELAY_MAX)
+            self.page_delay = self._paced_page_delay
+            self.carousel_delay = partial(
+                self._sleep_uniform, self.CAROUSEL_DELAY_MIN, self.CAROUSEL_DELAY_MAX
+            )
+            self.highlight_tray_delay = partial(
+                self._sleep_uniform, self.HIGHLIGHT_TRAY_DELAY_MIN, self.HIGHLIGHT_TRAY_DELAY_MAX
+            )
+            self.highlight_switch_delay = partial(
+                self._sleep_uniform,
+                self.HIGHLIGHT_SWITCH_DELAY_MIN,
+                self.HIGHLIGHT_SWITCH_DELAY_MAX,
+            )
+
+    def _uniform(self, low: float, high: float) -> float:
+        """Get a uniform random delay from a pre-generated batch."""
+        queue = self._uniform_cache.get((low, high))
+        if not queue:
+            queue = deque(self._rng.uniform(low, high) for _ in range(self.UNIFORM_BATCH_SIZE))
+            self._uniform_cache[(low, high)] = queue
+        return queue.popleft()
+
+    def _consume(self, tokens: float = 1.0) -> None:
+        """Take tokens from the pacing bucket, sleeping only for the deficit.
+
+        Tokens refill continuously at BUCKET_REFILL_RATE per second, which
+        spaces out requests smoothly instead of stalling on periodic breaks.
+        A deficit is left in the bucket as debt, so callers on other threads
+        (e.g. page prefetching) queue up behind it without holding the lock.
+        """
+        with self._bucket_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self.BUCKET_CAPACITY, self._tokens + elapsed * self.BUCKET_REFILL_RATE
+            )
+            self._last_refill = now
+            self._tokens -= tokens
+            delay = -self._tokens / self.BUCKET_REFILL_RATE
+
+        if delay > 0:
+            if delay >= 1.0 and not self._quiet:
+                console.print(f"[dim]Pausing for {delay:.0f}s...[/dim]")
             time.sleep(delay)
 
-    def carousel_delay(self) -> None:
-        """Delay between carousel items (simulates swiping)."""
-        if self._has_proxy:
-            time.sleep(self.AGGRESSIVE_CAROUSEL_DELAY)
-        else:
-            delay = random.uniform(self.CAROUSEL_DELAY_MIN, self.CAROUSEL_DELAY_MAX)
-            time.sleep(delay)
+    def _paced_page_delay(self) -> None:
+        """Pace a page fetch through the bucket, then add a scrolling jitter."""
+        self._consume(1.0)
+        self._sleep_uniform(self.PAGE_DELAY_MIN, self.PAGE_DELAY_MAX)
 
-    def highlight_tray_delay(self) -> None:
-        """Delay before fetching highlights tray (simulates scrolling to highlights row)."""
-        if self._has_proxy:
-            time.sleep(self.AGGRESSIVE_PAGE_DELAY)
-        else:
-            delay = random.uniform(self.HIGHLIGHT_TRAY_DELAY_MIN, self.HIGHLIGHT_TRAY_DELAY_MAX)
-            time.sleep(delay)
+    def _sleep_uniform(self, low: float, high: float) -> None:
+        """Sleep for a uniform random delay between low and high."""
+        time.sleep(self._uniform(low, high))
+
+    def carousel_delay_seconds(self, index: int) -> float:
+        """Get the swipe delay before carousel item index, without sleeping.
 
-    def highlight_switch_delay(self) -> None:
-        """Delay between viewing different highlights (simulates tapping next highlight)."""
+        Lets callers schedule the delay alongside concurrent downloads.
+        The first item (index 0) has no delay.
+        """
+        if index == 0:
+            return 0.0
         if self._has_proxy:
-            time.sleep(self.AGGRESSIVE_PAGE_DELAY)
-        else:
-            delay = random.uniform(self.HIGHLIGHT_SWITCH_DELAY_MIN, self.HIGHLIGHT_SWITCH_DELAY_MAX)
-            time.sleep(delay)
+            return self.AGGRESSIVE_CAROUSEL_DELAY
+        return self._uniform(self.CAROUSEL_DELAY_MIN, self.CAROUSEL_DELAY_MAX)
 
     def record_post_processed(self) -> None:
-        """Record that a post was processed, may trigger break."""
-        # Skip breaks with proxy
+        """Record that a post was processed, pacing if the bucket is empty."""
+        # No pacing with proxy
         if self._has_proxy:
             return
 
-        self._posts_since_break += 1
-
-        if self._posts_since_break >= self._next_break_at:
-            self._take_break()
-            self._posts_since_break = 0
-            self._next_break_at = self._random_break_interval()
-
-    def _take_break(self) -> None:
-        """Take a periodic break to simulate user resting."""
-        delay = random.uniform(self.BREAK_DURATION_MIN, self.BREAK_DURATION_MAX)
-
-        if not self._quiet:
-            console.print(f"[dim]Pausing for {delay:.0f}s...[/dim]")
-
-        time.sleep(delay)
+        self._consume(1.0)
@@ -149,6 +149,14 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code (0 for success, 1 for errors)
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: answer --version without building the full parser
+    if argv and argv[0] in ("-V", "--version"):
+        print(f"igdl {__version__}")
+        return 0
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
@@ -209,7 +217,11 @@ def main(argv: list[str] | None = None) -> int:
         ) as client:
             # Download each profile
             has_errors = False
-            for username in args.usernames:
+            for idx, username in enumerate(args.usernames):
+                # Look up the next profile while this one downloads
+                if idx + 1 < len(args.usernames):
+                    client.prefetch_profile(args.usernames[idx + 1])
+
                 # Determine archive for this username
                 if args.archive:
                     # Explicit archive file provided
@@ -2,13 +2,22 @@
 
 import http.cookiejar
 import json
+import os
+import random
 import re
+import shutil
 import time
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from threading import RLock
+from typing import Any, TypedDict
+from urllib.parse import urlsplit
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from rich.console import Console
 
 from .behavior import BehaviorSimulator
@@ -24,6 +33,19 @@ from .models import Highlight, HighlightItem, Post, PostsPage, Profile
 from .proxy import ProxyRotator
 from .rate_limiter import RateLimiter
 
+# Use orjson for faster JSON parsing if installed, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Use msgspec, if installed, to decode GraphQL posts pages against a schema of
+# only the fields PostsPage reads, skipping the rest of the payload
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
 console = Console()
 
 # GraphQL doc_id for fetching user posts (anonymous)
@@ -37,23 +59,145 @@ USER_AGENT = (
 )
 
 # Default headers mimicking Chrome browser
-DEFAULT_HEADERS = {
-    "Accept": "*/*",
-    "Accept-Encoding": "gzip, deflate",
-    "Accept-Language": "en-US,en;q=0.9",
-    "Connection": "keep-alive",
-    "Host": "www.instagram.com",
-    "Origin": "https://www.instagram.com",
-    "Referer": "https://www.instagram.com/",
-    "User-Agent": USER_AGENT,
-    "X-Requested-With": "XMLHttpRequest",
-    "X-IG-App-ID": "936619743392459",
-}
+# Accept-Encoding is left to requests, which adds br/zstd when a decoder is installed
+DEFAULT_HEADERS: CaseInsensitiveDict[str] = CaseInsensitiveDict(
+    {
+        "Accept": "*/*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Host": "www.instagram.com",
+        "Origin": "https://www.instagram.com",
+        "Referer": "https://www.instagram.com/",
+        "User-Agent": USER_AGENT,
+        "X-Requested-With": "XMLHttpRequest",
+        "X-IG-App-ID": "936619743392459",
+    }
+)
+
+# Patterns for extracting profile data from HTML (matched against raw bytes).
+# User ID variants are fused into one alternation so the page is scanned once.
+_USER_ID_RE = re.compile(
+    rb'"user_id":"(?P<a>\d+)"'
+    rb'|"profilePage_(?P<b>\d+)"'
+    rb'|"owner":\{"id":"(?P<c>\d+)"'
+    rb'|data-id="(?P<d>\d+)"'
+)
+_POST_COUNT_RE = re.compile(rb'"edge_owner_to_timeline_media":\{"count":(\d+)')
+_IS_PRIVATE_MARKER = b'"is_private":true'
+
+# "Please wait a few minutes" marker in 401 rate-limit responses
+_WAIT_RE = re.compile(rb"wait", re.IGNORECASE)
 
 # Headers for CDN media downloads (simpler, avoids Instagram-specific headers)
-CDN_HEADERS = {
-    "User-Agent": USER_AGENT,
-}
+CDN_HEADERS: CaseInsensitiveDict[str] = CaseInsensitiveDict(
+    {
+        "User-Agent": USER_AGENT,
+    }
+)
+
+
+class _CountNode(TypedDict, total=False):
+    count: int | None
+
+
+class _CaptionNode(TypedDict, total=False):
+    text: str | None
+
+
+class _CaptionEdge(TypedDict, total=False):
+    node: _CaptionNode
+
+
+class _CaptionEdges(TypedDict, total=False):
+    edges: list[_CaptionEdge]
+
+
+class _ChildNode(TypedDict, total=False):
+    is_video: bool | None
+    video_url: str | None
+    display_url: str | None
+
+
+class _ChildEdge(TypedDict, total=False):
+    node: _ChildNode
+
+
+class _ChildEdges(TypedDict, total=False):
+    edges: list[_ChildEdge]
+
+
+# Functional form because of the "__typename" key
+_PostNode = TypedDict(
+    "_PostNode",
+    {
+        "__typename": str | None,
+        "shortcode": str | None,
+        "display_url": str | None,
+        "video_url": str | None,
+        "is_video": bool | None,
+        "taken_at_timestamp": float | None,
+        "date": float | None,
+        "edge_media_to_caption": _CaptionEdges,
+        "edge_sidecar_to_children": _ChildEdges,
+        "edge_media_preview_like": _CountNode,
+        "edge_media_to_comment": _CountNode,
+    },
+    total=False,
+)
+
+
+class _PostEdge(TypedDict, total=False):
+    node: _PostNode
+
+
+class _PageInfo(TypedDict, total=False):
+    has_next_page: bool | None
+    end_cursor: str | None
+
+
+class _TimelineMedia(TypedDict, total=False):
+    edges: list[_PostEdge]
+    page_info: _PageInfo
+
+
+class _PostsUser(TypedDict, total=False):
+    edge_owner_to_timeline_media: _TimelineMedia
+
+
+class _PostsData(TypedDict, total=False):
+    user: _PostsUser | None
+
+
+class _PostsPageResponse(TypedDict, total=False):
+    data: _PostsData
+
+
+_POSTS_PAGE_DECODER = msgspec.json.Decoder(_PostsPageResponse) if msgspec is not None else None
+
+
+def _parse_json(response: requests.Response) -> Any:
+    """Parse JSON response body.
+
+    Uses orjson straight from the raw bytes when available. Both parsers
+    raise json.JSONDecodeError (or a subclass) on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.text)
+
+
+def _parse_posts_page_json(response: requests.Response) -> Any:
+    """Parse a GraphQL posts page response body.
+
+    With msgspec, only the fields PostsPage.from_api_response reads are
+    materialized. Payloads that don't match the schema (or aren't valid
+    JSON) fall back to _parse_json, which raises json.JSONDecodeError.
+    """
+    if _POSTS_PAGE_DECODER is not None:
+        try:
+            return _POSTS_PAGE_DECODER.decode(response.content)
+        except msgspec.DecodeError:
+            pass
+    return _parse_json(response)
 
 
 def load_cookies_file(path: Path) -> http.cookiejar.CookieJar:
@@ -75,6 +219,27 @@ class InstagramClient:
 
     BASE_URL = "https://www.instagram.com"
 
+    # Base delay for exponential backoff after rate limiting (seconds)
+    RATE_LIMIT_BACKOFF_BASE: float = 30.0
+
+    # Upper bound for the jittered network-error retry delay (seconds)
+    RETRY_BACKOFF_CAP: float = 60.0
+
+    # Mean delay of the first page fetch retry in iter_posts (seconds)
+    PAGE_RETRY_BACKOFF_BASE: float = 30.0
+
+    # Consecutive rate-limited responses before the session is rebuilt
+    SESSION_REFRESH_AFTER_THROTTLES: int = 3
+
+    # How long fetched profiles and highlight trays are reused (seconds)
+    CACHE_TTL_SECONDS: float = 300.0
+
+    # Keep-alive connections per CDN host; caps concurrent media downloads
+    CDN_POOL_MAXSIZE: int = 32
+    # CDN hosts whose pools are kept alive at once. Media is spread over many
+    # scontent-* edge hosts; a small LRU would close pools between profiles.
+    CDN_POOL_HOSTS: int = 16
+
     def __init__(
         self,
         rate_limiter: RateLimiter | None = None,
@@ -88,7 +253,22 @@ class InstagramClient:
         self.proxy_rotator = proxy_rotator or ProxyRotator()
         self.cookies_file = cookies_file
         self.timeout = timeout
+        self._authenticated = cookies_file is not None
+        # Pick the posts endpoint once: REST works better with cookies
+        self._get_page_impl = (
+            self._get_posts_page_rest if self._authenticated else self._get_posts_page_graphql
+        )
         self._session = self._create_session()
+        self._cdn_session = self._create_cdn_session()
+        self._profile_cache: dict[str, tuple[float, Profile]] = {}
+        self._highlights_cache: dict[str, tuple[float, list[Highlight]]] = {}
+        self._cookie_cache: tuple[float, http.cookiejar.CookieJar] | None = None
+        self._profile_prefetch: dict[str, Future[Profile]] = {}
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        # API requests run on prefetch threads too: the lock keeps the session
+        # from being replaced mid-request and guards the throttle counter
+        self._session_lock = RLock()
+        self._consecutive_throttles = 0
 
         # Load cookies if provided
         if cookies_file:
@@ -99,16 +279,49 @@ class InstagramClient:
         session = requests.Session()
         session.headers.update(DEFAULT_HEADERS)
 
+        # One keep-alive pool per proxy so rotation doesn't evict connections
+        adapter = HTTPAdapter(
+            pool_connections=max(1, len(self.proxy_rotator)),
+            pool_maxsize=32,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         # Set initial cookies
         session.cookies.set("ig_did", "", domain=".instagram.com")
         session.cookies.set("ig_nrcb", "1", domain=".instagram.com")
 
         return session
 
+    def _create_cdn_session(self) -> requests.Session:
+        """Create pooled session for CDN media downloads.
+
+        Kept separate from the API session so no Instagram headers or
+        cookies leak to the CDN, while connections are reused across files.
+        """
+        session = requests.Session()
+        session.headers.update(CDN_HEADERS)
+
+        adapter = HTTPAdapter(
+            pool_connections=self.CDN_POOL_HOSTS,
+            pool_maxsize=self.CDN_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+
+        return session
+
     def _load_cookies(self, path: Path) -> None:
         """Load cookies from file into session."""
         try:
-            cookie_jar = load_cookies_file(path)
+            # Reuse the parsed jar on session refresh unless the file changed
+            mtime = path.stat().st_mtime
+            if self._cookie_cache is not None and self._cookie_cache[0] == mtime:
+                cookie_jar = self._cookie_cache[1]
+            else:
+                cookie_jar = load_cookies_file(path)
+                self._cookie_cache = (mtime, cookie_jar)
             # Copy cookies to session
             for cookie in cookie_jar:
                 self._session.cookies.set_cookie(cookie)
@@ -122,11 +335,22 @@ class InstagramClient:
         Creates a new session and reloads cookies if available.
         """
         console.print("[dim]Refreshing session...[/dim]")
-        self._session.close()
-        self._session = self._create_session()
+        with self._session_lock:
+            self._session.close()
+            self._session = self._create_session()
+            self._profile_cache.clear()
+            self._highlights_cache.clear()
 
-        if self.cookies_file:
-            self._load_cookies(self.cookies_file)
+            if self.cookies_file:
+                self._load_cookies(self.cookies_file)
+
+    def _jittered_backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retrying after a network error.
+
+        Spreading retries uniformly over [0, 2**attempt] keeps parallel
+        runs from hitting the server in lockstep.
+        """
+        return random.uniform(0.0, min(self.RETRY_BACKOFF_CAP, 2.0**attempt))
 
     def _request(
         self,
@@ -136,43 +360,57 @@ class InstagramClient:
         **kwargs: Any,
     ) -> requests.Response:
         """Make HTTP request with rate limiting, retries, and proxy support."""
-        self.rate_limiter.wait_if_needed()
+        host = urlsplit(url).netloc
+        self.rate_limiter.wait_if_needed(host)
 
         for attempt in range(max_retries):
             try:
                 # Apply current proxy if available
                 proxies = self.proxy_rotator.get_proxies_dict()
 
-                response = self._session.request(
-                    method,
-                    url,
-                    timeout=self.timeout,
-                    proxies=proxies,
-                    **kwargs,
-                )
-                self.rate_limiter.record_request()
+                with self._session_lock:
+                    response = self._session.request(
+                        method,
+                        url,
+                        timeout=self.timeout,
+                        proxies=proxies,
+                        **kwargs,
+                    )
+                self.rate_limiter.record_request(host)
                 self.proxy_rotator.record_request()
 
                 # Handle rate limiting (429 or 401 with "wait" message)
                 if response.status_code == 429 or (
-                    response.status_code == 401 and "wait" in response.text.lower()
+                    response.status_code == 401 and _WAIT_RE.search(response.content)
                 ):
-                    # Rotate proxy on rate limit
+                    # Rotate proxy on rate limit (keeps pooled connections alive)
                     self.proxy_rotator.rotate_on_error()
+                    with self._session_lock:
+                        self._consecutive_throttles += 1
 
                     retry_after = float(response.headers.get("Retry-After", 300))
                     # If we have multiple proxies, retry immediately with new proxy
                     if self.proxy_rotator.has_multiple:
                         retry_after = 1.0
 
+                    # Out of retry budget: fail fast so the caller can back off
+                    if not self.rate_limiter.on_throttle():
+                        raise RateLimitError(retry_after)
+
                     if attempt < max_retries - 1:
+                        # Exponential backoff capped by Retry-After, with jitter
+                        backoff = self.RATE_LIMIT_BACKOFF_BASE * 2**attempt
+                        retry_after = min(retry_after, backoff) * random.uniform(0.5, 1.5)
                         console.print(
                             f"[yellow]Rate limited, waiting {retry_after:.0f}s "
                             f"(attempt {attempt + 1}/{max_retries})...[/yellow]"
                         )
                         time.sleep(retry_after)
-                        # Refresh session after rate limit wait
-                        self.refresh_session()
+                        # Only rebuild the session after repeated rate limits
+                        with self._session_lock:
+                            if self._consecutive_throttles >= self.SESSION_REFRESH_AFTER_THROTTLES:
+                                self.refresh_session()
+                                self._consecutive_throttles = 0
                         continue
                     raise RateLimitError(retry_after)
 
@@ -182,13 +420,16 @@ class InstagramClient:
                 if response.status_code >= 400:
                     raise ApiError(response.status_code, response.text[:200])
 
+                self.rate_limiter.on_success()
+                with self._session_lock:
+                    self._consecutive_throttles = 0
                 return response
 
             except requests.RequestException as e:
                 if attempt < max_retries - 1:
-                    wait_time = 2**attempt
+                    wait_time = self._jittered_backoff(attempt)
                     console.print(
-                        f"[yellow]Network error: {e}, retrying in {wait_time}s "
+                        f"[yellow]Network error: {e}, retrying in {wait_time:.1f}s "
                         f"(attempt {attempt + 1}/{max_retries})...[/yellow]"
                     )
                     time.sleep(wait_time)
@@ -198,19 +439,53 @@ class InstagramClient:
         raise ApiError(0, "Max retries exceeded")
 
     def get_profile(self, username: str) -> Profile:
-        """Fetch profile information by username."""
+        """Fetch profile information by username.
+
+        Results are cached for CACHE_TTL_SECONDS to avoid re-fetching.
+        """
+        cached = self._profile_cache.get(username)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        # Wait for a background fetch started by prefetch_profile
+        pending = self._profile_prefetch.pop(username, None)
+        if pending is not None:
+            return pending.result()
+
+        return self._fetch_profile(username)
+
+    def prefetch_profile(self, username: str) -> None:
+        """Start fetching a profile in the background.
+
+        Lets the next profile's lookup overlap with downloading the current
+        one; a later get_profile call picks up the result (or its error).
+        """
+        if username in self._profile_prefetch or username in self._profile_cache:
+            return
+        # Runs while the current profile's progress bar is live: stay quiet
+        # and leave reporting errors to get_profile on the main thread
+        self._profile_prefetch[username] = self._prefetch_executor.submit(
+            self._fetch_profile, username, quiet=True
+        )
+
+    def _fetch_profile(self, username: str, quiet: bool = False) -> Profile:
+        """Fetch profile information and store it in the profile cache."""
         # Try API endpoint first
         profile = self._get_profile_api(username)
-        if profile:
-            return profile
 
-        # Fallback to HTML parsing
-        console.print("[dim]API returned no data, trying HTML fallback...[/dim]")
-        profile = self._get_profile_html(username)
-        if profile:
-            return profile
+        if not profile:
+            # Fallback to HTML parsing
+            if not quiet:
+                console.print("[dim]API returned no data, trying HTML fallback...[/dim]")
+            profile = self._get_profile_html(username)
 
-        raise ProfileNotFoundError(username)
+        if not profile:
+            raise ProfileNotFoundError(username)
+
+        # Serialized with refresh_session, which clears the cache
+        with self._session_lock:
+            self._profile_cache[username] = (time.monotonic(), profile)
+        return profile
 
     def _get_profile_api(self, username: str) -> Profile | None:
         """Fetch profile via API endpoint."""
@@ -220,7 +495,7 @@ class InstagramClient:
         response = self._request("GET", url, params=params)
 
         try:
-            data = response.json()
+            data = _parse_json(response)
         except json.JSONDecodeError:
             return None
 
@@ -243,35 +518,23 @@ class InstagramClient:
         url = f"{self.BASE_URL}/{username}/"
         response = self._request("GET", url)
 
-        # Look for user ID in meta tag or script
-        html = response.text
-
-        # Try to find user_id from various patterns
-        patterns = [
-            r'"user_id":"(\d+)"',
-            r'"profilePage_(\d+)"',
-            r'"owner":\{"id":"(\d+)"',
-            r'data-id="(\d+)"',
-        ]
-
-        user_id = None
-        for pattern in patterns:
-            match = re.search(pattern, html)
-            if match:
-                user_id = match.group(1)
-                break
-
-        if not user_id:
+        # Look for user ID in meta tag or script (raw bytes, no decode needed)
+        html = response.content
+
+        # Find user_id from whichever pattern variant appears first
+        match = _USER_ID_RE.search(html)
+        if not match:
             return None
+        user_id = next(group for group in match.groups() if group).decode()
 
         # Try to get post count
         post_count = 0
-        count_match = re.search(r'"edge_owner_to_timeline_media":\{"count":(\d+)', html)
+        count_match = _POST_COUNT_RE.search(html)
         if count_match:
             post_count = int(count_match.group(1))
 
         # Check if private
-        is_private = '"is_private":true' in html
+        is_private = _IS_PRIVATE_MARKER in html
 
         if is_private:
             raise PrivateProfileError(username)
@@ -291,10 +554,7 @@ class InstagramClient:
         after: str | None = None,
     ) -> PostsPage:
         """Fetch a page of posts for a user."""
-        # Try REST API first (works better with cookies)
-        if self.cookies_file:
-            return self._get_posts_page_rest(user_id, first, after)
-        return self._get_posts_page_graphql(user_id, first, after)
+        return self._get_page_impl(user_id, first, after)
 
     def _get_posts_page_graphql(
         self,
@@ -305,22 +565,21 @@ class InstagramClient:
         """Fetch posts via GraphQL (anonymous access)."""
         url = f"{self.BASE_URL}/graphql/query"
 
-        variables = {
-            "id": user_id,
-            "first": first,
-        }
+        # Fixed-shape variables, built directly instead of via json.dumps(dict).
+        # user_id is numeric; the cursor is the only value that may need escaping.
+        variables = f'{{"id": "{user_id}", "first": {first:d}'
         if after:
-            variables["after"] = after
+            variables += f', "after": {json.dumps(after)}'
 
         params = {
             "doc_id": POSTS_DOC_ID,
-            "variables": json.dumps(variables),
+            "variables": variables + "}",
         }
 
         response = self._request("GET", url, params=params)
 
         try:
-            data = response.json()
+            data = _parse_posts_page_json(response)
         except json.JSONDecodeError as e:
             raise ApiError(response.status_code, "Invalid JSON response") from e
 
@@ -346,7 +605,7 @@ class InstagramClient:
         response = self._request("GET", url, params=params)
 
         try:
-            data = response.json()
+            data = _parse_json(response)
         except json.JSONDecodeError as e:
             raise ApiError(response.status_code, "Invalid JSON response") from e
 
@@ -368,60 +627,81 @@ class InstagramClient:
         Yields:
             Post objects
         """
-        cursor: str | None = None
         count = 0
-        consecutive_errors = 0
-
-        while True:
-            # Simulate scrolling delay between pages (except first)
-            if cursor is not None:
-                self.behavior.page_delay()
-
-            # Try to get page with retries
-            page = None
-            for attempt in range(max_page_retries):
-                try:
-                    page = self.get_posts_page(user_id, after=cursor)
-                    consecutive_errors = 0  # Reset on success
-                    break
-                except (ApiError, RateLimitError) as e:
-                    consecutive_errors += 1
-                    if attempt < max_page_retries - 1:
-                        wait_time = 30 * (attempt + 1)  # 30s, 60s, 90s
-                        console.print(
-                            f"[yellow]Page fetch failed: {e}. "
-                            f"Waiting {wait_time}s and retrying "
-                            f"(attempt {attempt + 1}/{max_page_retries})...[/yellow]"
-                        )
-                        time.sleep(wait_time)
-                        self.refresh_session()
-                        continue
-                    else:
-                        # All retries failed, but we may have partial data
-                        console.print(
-                            f"[red]Failed to fetch page after {max_page_retries} attempts. "
-                            f"Stopping iteration (downloaded {count} posts).[/red]"
-                        )
-                        return
 
-            if page is None:
-                return
+        # The next page is fetched in the background while the caller
+        # processes (downloads) the posts of the current one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = self._fetch_posts_page(user_id, None, max_page_retries)
+
+            while page is not None:
+                next_page: Future[PostsPage | None] | None = None
+                if (
+                    page.has_next_page
+                    and page.end_cursor
+                    and not (limit and count + len(page.posts) >= limit)
+                ):
+                    next_page = executor.submit(
+                        self._fetch_posts_page, user_id, page.end_cursor, max_page_retries
+                    )
+
+                for post in page.posts:
+                    yield post
+                    count += 1
 
-            for post in page.posts:
-                yield post
-                count += 1
+                    if limit and count >= limit:
+                        return
 
-                if limit and count >= limit:
+                if next_page is None:
                     return
 
-            if not page.has_next_page or not page.end_cursor:
-                break
+                page = next_page.result()
+
+            # All retries failed, but we may have partial data
+            console.print(
+                f"[red]Failed to fetch page after {max_page_retries} attempts. "
+                f"Stopping iteration (downloaded {count} posts).[/red]"
+            )
+
+    def _fetch_posts_page(
+        self, user_id: str, cursor: str | None, max_page_retries: int
+    ) -> PostsPage | None:
+        """Fetch one page of posts, retrying on API errors.
+
+        Args:
+            user_id: Instagram user ID
+            cursor: Pagination cursor (None for the first page)
+            max_page_retries: Max retries for the page on error
+
+        Returns:
+            The page, or None if all retries failed
+        """
+        # Simulate scrolling delay between pages (except first)
+        if cursor is not None:
+            self.behavior.page_delay()
+
+        for attempt in range(max_page_retries):
+            try:
+                return self._get_page_impl(user_id, after=cursor)
+            except (ApiError, RateLimitError) as e:
+                if attempt < max_page_retries - 1:
+                    # Averages 30s, 60s, 90s; jitter keeps parallel runs from retrying together
+                    wait_time = random.uniform(
+                        0.0, 2 * self.PAGE_RETRY_BACKOFF_BASE * (attempt + 1)
+                    )
+                    console.print(
+                        f"[yellow]Page fetch failed: {e}. "
+                        f"Waiting {wait_time:.0f}s and retrying "
+                        f"(attempt {attempt + 1}/{max_page_retries})...[/yellow]"
+                    )
+                    time.sleep(wait_time)
+                    self.refresh_session()
 
-            cursor = page.end_cursor
+        return None
 
     def _require_cookies(self, feature: str) -> None:
         """Raise AuthenticationError if no cookies are loaded."""
-        if not self.cookies_file:
+        if not self._authenticated:
             raise AuthenticationError(f"{feature} requires cookies (use --cookies)")
 
     def get_highlights(self, user_id: str) -> list[Highlight]:
@@ -429,6 +709,7 @@ class InstagramClient:
 
         Requires authentication (cookies). Returns highlights with metadata
         only — items must be fetched separately via get_highlight_items().
+        The tray is cached per user for CACHE_TTL_SECONDS.
 
         Args:
             user_id: Instagram user ID.
@@ -440,17 +721,24 @@ class InstagramClient:
             AuthenticationError: If no cookies are loaded.
         """
         self._require_cookies("Highlights")
+
+        cached = self._highlights_cache.get(user_id)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return list(cached[1])
+
         url = f"{self.BASE_URL}/api/v1/highlights/{user_id}/highlights_tray/"
 
         response = self._request("GET", url)
 
         try:
-            data = response.json()
+            data = _parse_json(response)
         except json.JSONDecodeError as e:
             raise ApiError(response.status_code, "Invalid JSON in highlights tray") from e
 
         tray = data.get("tray", [])
-        return [Highlight.from_tray_item(item) for item in tray]
+        highlights = [Highlight.from_tray_item(item) for item in tray]
+        self._highlights_cache[user_id] = (time.monotonic(), highlights)
+        return list(highlights)
 
     def get_highlight_items(self, highlight_id: str) -> list[HighlightItem]:
         """Fetch media items for a specific highlight reel.
@@ -474,7 +762,7 @@ class InstagramClient:
         response = self._request("GET", url, params={"reel_ids": reel_id})
 
         try:
-            data = response.json()
+            data = _parse_json(response)
         except json.JSONDecodeError as e:
             raise ApiError(response.status_code, "Invalid JSON in highlight items") from e
 
@@ -488,10 +776,12 @@ class InstagramClient:
         filepath: Path,
         max_retries: int = 3,
         timeout: float = 60.0,
-    ) -> None:
+        etag: str | None = None,
+    ) -> tuple[bool, str | None]:
         """Download media content from URL directly to file.
 
-        Uses streaming to avoid loading large files into memory.
+        Uses streaming to avoid loading large files into memory. Data is
+        written to "<name>.part" and renamed into place once complete.
 
         Note: Media is served from CDN, not Instagram API.
         Uses minimal headers to avoid CDN rejecting the request.
@@ -501,41 +791,86 @@ class InstagramClient:
             filepath: Destination file path
             max_retries: Maximum retry attempts for failed downloads
             timeout: Timeout for download (longer than API requests)
+            etag: ETag of the existing file; only sent (as a conditional
+                request) when filepath exists, and the body is skipped when unchanged
+
+        Returns:
+            Tuple of (modified, etag): modified is False only when the CDN
+            answered 304 Not Modified; etag is the one it reported
         """
         last_error: Exception | None = None
+        headers = {"If-None-Match": etag} if etag and filepath.exists() else None
+        # Stream into a side file and rename it into place when complete, so
+        # filepath never holds a truncated download (and an old copy survives)
+        part = filepath.with_name(filepath.name + ".part")
 
         for attempt in range(max_retries):
             try:
-                response = requests.get(
-                    url,
-                    timeout=timeout,
-                    stream=True,
-                    headers=CDN_HEADERS,
-                )
-                response.raise_for_status()
-
-                with filepath.open("wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                return  # Success
-
-            except requests.RequestException as e:
+                with self._cdn_session.get(
+                    url, timeout=timeout, stream=True, headers=headers
+                ) as response:
+                    if response.status_code == 304:
+                        return False, etag  # Not modified, keep existing file
+
+                    response.raise_for_status()
+                    # Copy from the socket in 1 MiB blocks instead of 8 KiB Python chunks
+                    response.raw.decode_content = True
+                    with part.open("wb") as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+                    os.replace(part, filepath)
+                    return True, response.headers.get("ETag")
+
+            # Reading response.raw directly surfaces urllib3 errors unwrapped
+            except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
                 last_error = e
                 # Clean up partial file
-                if filepath.exists():
-                    filepath.unlink()
+                part.unlink(missing_ok=True)
 
                 if attempt < max_retries - 1:
-                    wait_time = 2**attempt
-                    time.sleep(wait_time)
+                    time.sleep(self._jittered_backoff(attempt))
                     continue
 
         # All retries failed
         raise DownloadError(url, str(last_error)) from last_error
 
+    def download_many(
+        self, items: Iterable[tuple[str, Path, str | None]], workers: int = 8
+    ) -> list[tuple[bool, str | None] | DownloadError]:
+        """Download several media files concurrently over the CDN session.
+
+        CDN downloads are network-bound, so a small thread pool sharing the
+        session's keep-alive connections hides per-request latency. Items are
+        consumed lazily on the calling thread, so a generator can pace
+        submissions (e.g. swipe delays) while earlier downloads are in flight.
+
+        Args:
+            items: (url, filepath, etag) triples, passed on to download_media
+            workers: Number of concurrent downloads (capped at CDN_POOL_MAXSIZE)
+
+        Returns:
+            One result per item, in input order: download_media's
+            (modified, etag) tuple, or the DownloadError the item raised
+        """
+        workers = max(1, min(workers, self.CDN_POOL_MAXSIZE))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.download_media, url, filepath, etag=etag)
+                for url, filepath, etag in items
+            ]
+
+        results: list[tuple[bool, str | None] | DownloadError] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except DownloadError as e:
+                results.append(e)
+        return results
+
     def close(self) -> None:
-        """Close the session."""
+        """Close the API and CDN sessions."""
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
         self._session.close()
+        self._cdn_session.close()
 
     def __enter__(self) -> "InstagramClient":
         return self
@@ -1,7 +1,9 @@
 """Configuration management for igdl."""
 
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,53 @@ CONFIG_DIR = Path.home() / ".config" / "igdl"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
 
+_HOME = str(Path.home())
+
+
+def _expand(value: Any) -> Path:
+    """Convert a config value to a path, expanding a leading ~ to the home directory."""
+    value = str(value)
+    if not value.startswith("~"):
+        return Path(value)
+    if value == "~" or value[1] in "/\\":
+        return Path(_HOME + value[1:])
+    # ~user form needs a passwd lookup
+    return Path(value).expanduser()
+
+
+# Config key -> converter applied to its TOML value
+_FIELD_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "proxy": str,
+    "proxy_file": _expand,
+    "cookies": _expand,
+    "output": _expand,
+    "auto_archive": bool,
+    "archive_dir": _expand,
+}
+
+
+@lru_cache(maxsize=1)
+def _read_config_file(mtime: float) -> dict[str, Any] | None:
+    """Parse the config file, cached until its mtime changes.
+
+    Args:
+        mtime: Modification time of CONFIG_FILE, used only as the cache key
+
+    Returns:
+        Parsed TOML data, or None if the file is missing or invalid
+    """
+    if tomllib is None:
+        # No TOML parser available
+        return None
+
+    try:
+        with CONFIG_FILE.open("rb") as f:
+            data: dict[str, Any] = tomllib.load(f)
+    except Exception:
+        return None
+    return data
+
+
 @dataclass
 class Config:
     """Application configuration."""
@@ -32,20 +81,24 @@ class Config:
 
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from file."""
-        if not CONFIG_FILE.exists():
+        """Load configuration from file.
+
+        The file is only re-parsed when its mtime changes; a fresh Config
+        is built from the cached data on every call.
+        """
+        try:
+            mtime = CONFIG_FILE.stat().st_mtime
+        except OSError:
             return cls()
 
-        if tomllib is None:
-            # No TOML parser available, return defaults
+        data = _read_config_file(mtime)
+        if data is None:
+            # Missing parser or invalid config, return defaults
             return cls()
 
         try:
-            with CONFIG_FILE.open("rb") as f:
-                data = tomllib.load(f)
             return cls.from_dict(data)
         except Exception:
-            # Invalid config, return defaults
             return cls()
 
     @classmethod
@@ -53,23 +106,10 @@ class Config:
         """Create Config from dictionary."""
         config = cls()
 
-        if "proxy" in data:
-            config.proxy = data["proxy"]
-
-        if "proxy_file" in data:
-            config.proxy_file = Path(data["proxy_file"]).expanduser()
-
-        if "cookies" in data:
-            config.cookies = Path(data["cookies"]).expanduser()
-
-        if "output" in data:
-            config.output = Path(data["output"]).expanduser()
-
-        if "auto_archive" in data:
-            config.auto_archive = bool(data["auto_archive"])
-
-        if "archive_dir" in data:
-            config.archive_dir = Path(data["archive_dir"]).expanduser()
+        for key, value in data.items():
+            convert = _FIELD_CONVERTERS.get(key)
+            if convert is not None:
+                setattr(config, key, convert(value))
 
         return config
 
@@ -1,9 +1,14 @@
 """Download orchestration for Instagram media."""
 
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
-from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeRemainingColumn
 
 from .archive import DownloadArchive
 from .aria2 import Aria2Downloader
@@ -13,9 +18,50 @@ from .models import Highlight, HighlightItem, MediaItem, Post
 
 console = Console()
 
-# Number of posts to collect before flushing to aria2c
+# Number of posts (or queued media items) to collect before flushing to aria2c
 ARIA2_BATCH_SIZE = 50
 
+# Archived entries buffered before an fsync in the requests download paths;
+# bounds what a crash can lose while still batching writes
+ARCHIVE_FLUSH_INTERVAL = 50
+
+# Concurrent CDN downloads per carousel post (requests fallback)
+MEDIA_DOWNLOAD_WORKERS = 6
+
+# Suffix of the file next to the archive mapping media filenames to CDN ETags
+# (for conditional GETs when re-downloading with --no-skip-existing)
+ETAGS_SUFFIX = ".etags.json"
+
+
+class _BatchedProgress:
+    """Coalesce progress.advance() calls into periodic task updates.
+
+    Each advance() on a rich Progress takes its lock and records a speed
+    sample; on fast runs that is called hundreds of times per second.
+    Advances are accumulated here and applied at most every min_interval.
+    """
+
+    def __init__(self, progress: Progress, task: TaskID, min_interval: float = 0.1) -> None:
+        self.progress = progress
+        self.task = task
+        self.min_interval = min_interval
+        self._pending = 0
+        self._last = time.monotonic()
+
+    def advance(self, steps: int = 1) -> None:
+        """Record progress, updating the task once min_interval has passed."""
+        self._pending += steps
+        now = time.monotonic()
+        if now - self._last >= self.min_interval:
+            self._last = now
+            self.flush()
+
+    def flush(self) -> None:
+        """Apply any accumulated advances to the task."""
+        if self._pending:
+            self.progress.update(self.task, advance=self._pending)
+            self._pending = 0
+
 
 class Downloader:
     """High-level download orchestration.
@@ -38,24 +84,90 @@ class Downloader:
         self.quiet = quiet
         self.archive = archive or DownloadArchive(None)
         self._use_aria2 = Aria2Downloader.is_available()
+        # Progress bars are only rendered on a terminal; piped output skips them
+        self._hide_progress = quiet or not console.is_terminal
         self._current_username: str = ""
+        # "{username}_", built once per profile instead of per filename
+        self._username_prefix: str = ""
+        self._etags: dict[str, str] = {}
+        self._etags_dirty = False
+        # Names of files present in each target directory (one scandir per directory)
+        self._existing_cache: dict[Path, set[str]] = {}
 
         if self._use_aria2 and not quiet:
             console.print("[dim]Using aria2c for downloads[/dim]")
 
-    def _get_filename(self, username: str, post: Post, media: MediaItem) -> str:
-        """Generate filename for media item.
+    @staticmethod
+    def _get_filename(stem: str, media: MediaItem) -> str:
+        """Generate filename for a media item.
+
+        Format: {stem}.{ext} or {stem}_{index}.{ext} for carousel items
 
-        Format: {username}_{shortcode}.{ext} or {username}_{shortcode}_{index}.{ext} for carousel
+        Args:
+            stem: Username prefix followed by the post shortcode (built once per post)
+            media: Media item to name
         """
-        if media.index is not None:
-            return f"{username}_{post.shortcode}_{media.index}.{media.extension}"
-        return f"{username}_{post.shortcode}.{media.extension}"
+        if media.index is None:
+            return f"{stem}.{media.extension}"
+        return f"{stem}_{media.index}.{media.extension}"
 
     def _ensure_dir(self, path: Path) -> None:
         """Create directory if it doesn't exist."""
         path.mkdir(parents=True, exist_ok=True)
 
+    def _existing_names(self, target_dir: Path) -> set[str]:
+        """Get names of files in target_dir, scanning it only on first use."""
+        names = self._existing_cache.get(target_dir)
+        if names is None:
+            try:
+                with os.scandir(target_dir) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            self._existing_cache[target_dir] = names
+        return names
+
+    def _etags_path(self) -> Path | None:
+        """Get the ETag file stored alongside the archive (None without an archive)."""
+        path = self.archive.path
+        return path.with_name(path.name + ETAGS_SUFFIX) if path else None
+
+    def _load_etags(self) -> None:
+        """Load stored CDN ETags from alongside the archive."""
+        path = self._etags_path()
+        data: object = {}
+        if path:
+            try:
+                data = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                pass
+        self._etags = data if isinstance(data, dict) else {}
+        self._etags_dirty = False
+
+    def _save_etags(self) -> None:
+        """Persist CDN ETags alongside the archive if any changed."""
+        path = self._etags_path()
+        if path and self._etags_dirty:
+            path.write_text(json.dumps(self._etags), encoding="utf-8")
+            self._etags_dirty = False
+
+    def _store_etag(self, name: str, old: str | None, new: str | None) -> None:
+        """Remember the ETag the CDN reported for a file, if it changed."""
+        if new and new != old:
+            self._etags[name] = new
+            self._etags_dirty = True
+
+    def _download_with_etag(self, url: str, filepath: Path) -> bool:
+        """Download url to filepath, revalidating an existing file by ETag.
+
+        Returns:
+            True if the file was downloaded, False if the CDN reported it unchanged
+        """
+        etag = self._etags.get(filepath.name)
+        modified, new_etag = self.client.download_media(url, filepath, etag=etag)
+        self._store_etag(filepath.name, etag, new_etag)
+        return modified
+
     def download_media_item(
         self,
         post: Post,
@@ -67,39 +179,71 @@ class Downloader:
         Returns:
             Path to downloaded file, or None if skipped
         """
-        filename = self._get_filename(self._current_username, post, media)
+        filename = self._get_filename(self._username_prefix + post.shortcode, media)
         filepath = target_dir / filename
 
-        if self.skip_existing and filepath.exists():
+        if self.skip_existing and filename in self._existing_names(target_dir):
             return None
 
-        self.client.download_media(media.url, filepath)
+        if not self._download_with_etag(media.url, filepath):
+            return None
+        self._existing_names(target_dir).add(filename)
         return filepath
 
     def download_post(self, post: Post, target_dir: Path) -> list[Path]:
         """Download all media from a post.
 
+        Items go through client.download_many, so carousel items download
+        concurrently. Each item is submitted after its simulated swipe delay,
+        so the swipe delays overlap with transfers already in flight: a post
+        takes about max(swipe time, network time) rather than their sum.
+
+        Items whose files already exist are dropped up front, so a fully
+        downloaded post costs one cached directory lookup per item.
+
         Returns:
             List of paths to downloaded files
         """
-        self._ensure_dir(target_dir)
-        downloaded: list[Path] = []
-        media_items = post.get_media_items()
-
-        for idx, media in enumerate(media_items):
-            # Simulate carousel swiping delay (except first item)
-            if idx > 0:
-                self.client.behavior.carousel_delay()
+        stem = self._username_prefix + post.shortcode
+        named = [(m, self._get_filename(stem, m)) for m in post.get_media_items()]
+        if self.skip_existing:
+            existing = self._existing_names(target_dir)
+            named = [(m, filename) for m, filename in named if filename not in existing]
+            if not named:
+                return []
 
-            try:
-                path = self.download_media_item(post, media, target_dir)
-                if path:
-                    downloaded.append(path)
-            except DownloadError as e:
+        self._ensure_dir(target_dir)
+        media_items = [m for m, _ in named]
+        filepaths = [target_dir / filename for _, filename in named]
+        etags = [self._etags.get(filepath.name) for filepath in filepaths]
+        delay_seconds = self.client.behavior.carousel_delay_seconds
+
+        def submissions() -> Iterator[tuple[str, Path, str | None]]:
+            for idx, media in enumerate(media_items):
+                # Simulate carousel swiping before submitting each item
+                delay = delay_seconds(idx)
+                if delay > 0:
+                    time.sleep(delay)
+                yield media.url, filepaths[idx], etags[idx]
+
+        results = self.client.download_many(
+            submissions(), workers=min(len(media_items), MEDIA_DOWNLOAD_WORKERS)
+        )
+
+        # ETags and the existing-names cache are only touched on this thread
+        paths: list[Path] = []
+        existing = self._existing_names(target_dir)
+        for filepath, etag, result in zip(filepaths, etags, results, strict=True):
+            if isinstance(result, DownloadError):
                 if not self.quiet:
-                    console.print(f"[red]Failed to download {post.shortcode}: {e}[/red]")
-
-        return downloaded
+                    console.print(f"[red]Failed to download {post.shortcode}: {result}[/red]")
+                continue
+            modified, new_etag = result
+            self._store_etag(filepath.name, etag, new_etag)
+            if modified:
+                existing.add(filepath.name)
+                paths.append(filepath)
+        return paths
 
     def _collect_post_media(
         self,
@@ -115,15 +259,20 @@ class Downloader:
         added = 0
         media_items = post.get_media_items()
 
+        existing = self._existing_names(target_dir)
+        shortcode = post.shortcode
+        stem = self._username_prefix + shortcode
+        skip_existing = self.skip_existing
+        add = aria2.add
+
         for media in media_items:
-            filename = self._get_filename(self._current_username, post, media)
-            filepath = target_dir / filename
+            filename = self._get_filename(stem, media)
 
-            if self.skip_existing and filepath.exists():
+            if skip_existing and filename in existing:
                 continue
 
-            aria2.add(url=media.url, filename=filename, shortcode=post.shortcode)
-            added += 1
+            if add(url=media.url, filename=filename, shortcode=shortcode):
+                added += 1
 
         return added
 
@@ -157,6 +306,7 @@ class Downloader:
         target_dir = self.output_dir / subdir
         self._ensure_dir(target_dir)
         self._current_username = username
+        self._username_prefix = f"{username}_"
 
         # Choose download method
         if self._use_aria2:
@@ -180,37 +330,50 @@ class Downloader:
         downloaded_count = 0
         skipped_count = 0
         total = min(limit, post_count) if limit else post_count
+        archived = self.archive.snapshot()
+        # Newly downloaded shortcodes, archived every ARCHIVE_FLUSH_INTERVAL entries
+        pending: list[str] = []
+        self._load_etags()
+
+        try:
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TextColumn("{task.completed}/{task.total}"),
+                TimeRemainingColumn(),
+                console=console,
+                disable=self._hide_progress,
+            ) as progress:
+                task = progress.add_task(f"[cyan]Downloading {username}", total=total)
+                bar = _BatchedProgress(progress, task)
+
+                for post in self.client.iter_posts(user_id, limit=limit):
+                    # Skip if already in archive
+                    if post.shortcode.encode() in archived:
+                        if not self.quiet:
+                            console.print(f"[dim]Skipping {post.shortcode} (archived)[/dim]")
+                        skipped_count += 1
+                        bar.advance()
+                        continue
 
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeRemainingColumn(),
-            console=console,
-            disable=self.quiet,
-        ) as progress:
-            task = progress.add_task(f"[cyan]Downloading {username}", total=total)
-
-            for post in self.client.iter_posts(user_id, limit=limit):
-                # Skip if already in archive
-                if post.shortcode in self.archive:
-                    if not self.quiet:
-                        console.print(f"[dim]Skipping {post.shortcode} (archived)[/dim]")
-                    skipped_count += 1
-                    progress.advance(task)
-                    continue
+                    paths = self.download_post(post, target_dir)
 
-                paths = self.download_post(post, target_dir)
+                    if paths:
+                        downloaded_count += len(paths)
+                        pending.append(post.shortcode)
+                        if len(pending) >= ARCHIVE_FLUSH_INTERVAL:
+                            self._archive_pending(pending)
+                    else:
+                        skipped_count += 1
 
-                if paths:
-                    downloaded_count += len(paths)
-                    self.archive.add(post.shortcode)
-                else:
-                    skipped_count += 1
+                    bar.advance()
+                    self.client.behavior.record_post_processed()
 
-                progress.advance(task)
-                self.client.behavior.record_post_processed()
+                bar.flush()
+        finally:
+            self._archive_pending(pending)
+            self._save_etags()
 
         if not self.quiet:
             console.print(
@@ -219,6 +382,12 @@ class Downloader:
 
         return downloaded_count, skipped_count
 
+    def _archive_pending(self, pending: list[str]) -> None:
+        """Write buffered archive entries, fsync the archive, and clear the buffer."""
+        self.archive.add_many(pending)
+        self.archive.flush()
+        pending.clear()
+
     def _download_profile_aria2(
         self,
         username: str,
@@ -227,8 +396,15 @@ class Downloader:
         limit: int | None,
         post_count: int,
     ) -> tuple[int, int]:
-        """Download profile using aria2c batch downloads."""
-        aria2 = Aria2Downloader(output_dir=target_dir, quiet=self.quiet)
+        """Download profile using aria2c batch downloads.
+
+        Each full batch is handed to aria2c in the background while the next
+        batch is listed, so page fetches overlap with transfers. At most one
+        batch downloads at a time. The worker only runs aria2c; its results
+        are recorded on this thread once collected, and the archive's writer
+        thread persists them so the next batch starts without waiting on fsync.
+        """
+        aria2 = self._new_aria2(target_dir)
 
         # Try to resume incomplete download first
         resumed, _ = aria2.resume(username)
@@ -237,56 +413,75 @@ class Downloader:
 
         downloaded_count = 0
         skipped_count = 0
-        posts_in_batch: list[Post] = []
+        # Posts queued in the current aria2c batch
+        batch_posts = 0
         total = min(limit, post_count) if limit else post_count
-
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeRemainingColumn(),
-            console=console,
-            disable=self.quiet,
-        ) as progress:
+        archived = self.archive.snapshot()
+        running: Future[tuple[set[str], int]] | None = None
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TextColumn("{task.completed}/{task.total}"),
+                TimeRemainingColumn(),
+                console=console,
+                disable=self._hide_progress,
+            ) as progress,
+        ):
             task = progress.add_task(f"[cyan]Fetching {username}", total=total)
+            bar = _BatchedProgress(progress, task)
 
-            for post in self.client.iter_posts(user_id, limit=limit):
-                # Skip if already in archive
-                if post.shortcode in self.archive:
-                    skipped_count += 1
-                    progress.advance(task)
-                    continue
-
-                # Collect media for aria2c
-                added = self._collect_post_media(post, target_dir, aria2)
-                if added > 0:
-                    posts_in_batch.append(post)
-                else:
-                    # All media already exists
-                    skipped_count += 1
-
-                progress.advance(task)
-                self.client.behavior.record_post_processed()
-
-                # Flush batch when reaching size limit
-                if len(posts_in_batch) >= ARIA2_BATCH_SIZE:
-                    successful_shortcodes, failed = aria2.flush(username)
+            try:
+                for post in self.client.iter_posts(user_id, limit=limit):
+                    # Skip if already in archive
+                    if post.shortcode.encode() in archived:
+                        skipped_count += 1
+                        bar.advance()
+                        continue
 
-                    # Update archive with successful downloads
-                    for shortcode in successful_shortcodes:
-                        self.archive.add(shortcode)
-                        downloaded_count += 1
+                    # Collect media for aria2c
+                    added = self._collect_post_media(post, target_dir, aria2)
+                    if added > 0:
+                        batch_posts += 1
+                    else:
+                        # All media already exists
+                        skipped_count += 1
 
-                    posts_in_batch.clear()
+                    bar.advance()
+                    self.client.behavior.record_post_processed()
+
+                    # Flush batch when reaching size limit
+                    if batch_posts >= ARIA2_BATCH_SIZE or len(aria2) >= ARIA2_BATCH_SIZE:
+                        # Wait for the previous batch so aria2c runs one batch at a time
+                        if running is not None:
+                            finished, running = running, None
+                            downloaded_count += self._record_aria2_batch(
+                                finished.result(), target_dir
+                            )
+                        running = executor.submit(aria2.flush, username)
+                        aria2 = self._new_aria2(target_dir)
+                        batch_posts = 0
+
+                bar.flush()
+            finally:
+                # Also runs when listing fails part-way (rate limit, network
+                # error, Ctrl+C): the batch in flight still downloads, so its
+                # posts must be counted and archived
+                try:
+                    if running is not None:
+                        downloaded_count += self._record_aria2_batch(running.result(), target_dir)
+                finally:
+                    # Wait for the archive writer, so entries are on disk
+                    # before an error propagates
+                    self.archive.flush()
 
         # Flush remaining items
         if len(aria2) > 0:
-            successful_shortcodes, failed = aria2.flush(username)
-
-            for shortcode in successful_shortcodes:
-                self.archive.add(shortcode)
-                downloaded_count += 1
+            downloaded_count += self._record_aria2_batch(aria2.flush(username), target_dir)
+            self.archive.flush()
 
         if not self.quiet:
             console.print(
@@ -295,6 +490,31 @@ class Downloader:
 
         return downloaded_count, skipped_count
 
+    def _new_aria2(self, target_dir: Path) -> Aria2Downloader:
+        """Create an aria2c queue for target_dir that skips archived shortcodes."""
+        return Aria2Downloader(
+            output_dir=target_dir,
+            quiet=self.quiet,
+            skip_predicate=self.archive.contains,
+        )
+
+    def _record_aria2_batch(self, result: tuple[set[str], int], target_dir: Path) -> int:
+        """Archive the successful shortcodes of a finished aria2c batch.
+
+        Called on the main thread before the next batch starts, so a rescan
+        of target_dir never sees partial files from a running aria2c. The
+        archive write and fsync are queued on the archive's writer thread;
+        entries are visible to contains() right away.
+
+        Returns:
+            Number of shortcodes downloaded
+        """
+        successful_shortcodes, _ = result
+        if self._existing_cache.pop(target_dir, None) is not None:
+            self._existing_names(target_dir)
+        self.archive.add_many_in_background(successful_shortcodes)
+        return len(successful_shortcodes)
+
     def download_profiles(
         self,
         usernames: list[str],
@@ -307,7 +527,11 @@ class Downloader:
         """
         results: dict[str, tuple[int, int]] = {}
 
-        for username in usernames:
+        for idx, username in enumerate(usernames):
+            # Look up the next profile while this one downloads
+            if idx + 1 < len(usernames):
+                self.client.prefetch_profile(usernames[idx + 1])
+
             try:
                 results[username] = self.download_profile(username, limit=limit)
             except IgdlError as e:
@@ -322,22 +546,30 @@ class Downloader:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _deduplicate_slug(slug: str, used: set[str]) -> str:
+    def _deduplicate_slug(slug: str, used: dict[str, int]) -> str:
         """Return a unique slug, appending _2, _3, ... on collision.
 
+        Each used slug remembers the next suffix to try, so repeated titles
+        don't re-probe every earlier suffix.
+
         Args:
             slug: Base slug to deduplicate.
-            used: Set of already-used slugs (mutated in-place).
+            used: Used slugs mapped to their next free suffix (mutated in-place).
 
         Returns:
             Unique slug that has been added to *used*.
         """
-        candidate = slug
-        counter = 2
+        counter = used.get(slug)
+        if counter is None:
+            used[slug] = 2
+            return slug
+
+        candidate = f"{slug}_{counter}"
         while candidate in used:
-            candidate = f"{slug}_{counter}"
             counter += 1
-        used.add(candidate)
+            candidate = f"{slug}_{counter}"
+        used[slug] = counter + 1
+        used[candidate] = 2
         return candidate
 
     def _get_highlight_filename(
@@ -378,6 +610,7 @@ class Downloader:
 
         profile = self.client.get_profile(username)
         self._current_username = username
+        self._username_prefix = f"{username}_"
 
         # Simulate scrolling to highlights row
         self.client.behavior.highlight_tray_delay()
@@ -409,65 +642,84 @@ class Downloader:
         """Download highlights using requests (fallback method)."""
         downloaded_count = 0
         skipped_count = 0
-        used_slugs: set[str] = set()
+        used_slugs: dict[str, int] = {}
+        highlights_dir = self.output_dir / username / "highlights"
+        # Parents are created once; each highlight then needs a single mkdir
+        self._ensure_dir(highlights_dir)
+        archived = self.archive.snapshot()
+        # Newly downloaded media IDs, archived every ARCHIVE_FLUSH_INTERVAL entries
+        pending: list[str] = []
+        self._load_etags()
 
         total_items = sum(h.media_count for h in highlights)
 
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeRemainingColumn(),
-            console=console,
-            disable=self.quiet,
-        ) as progress:
-            task = progress.add_task(
-                f"[cyan]Highlights {username}",
-                total=total_items,
-            )
-
-            for highlight in highlights:
-                slug = self._deduplicate_slug(highlight.slug, used_slugs)
-                target_dir = self.output_dir / username / "highlights" / slug
-                self._ensure_dir(target_dir)
-
-                if not self.quiet:
-                    console.print(
-                        f"[dim]Highlight: {highlight.title!r} -> {slug}/ "
-                        f"({highlight.media_count} items)[/dim]"
-                    )
-
-                # Simulate tapping on a highlight
-                self.client.behavior.highlight_switch_delay()
-
-                # Fetch items for this highlight
-                items = self.client.get_highlight_items(highlight.highlight_id)
-
-                for item in items:
-                    # Skip if in archive
-                    if item.media_id in self.archive:
-                        skipped_count += 1
-                        progress.advance(task)
-                        continue
-
-                    filename = self._get_highlight_filename(username, item)
-                    filepath = target_dir / filename
+        try:
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TextColumn("{task.completed}/{task.total}"),
+                TimeRemainingColumn(),
+                console=console,
+                disable=self._hide_progress,
+            ) as progress:
+                task = progress.add_task(
+                    f"[cyan]Highlights {username}",
+                    total=total_items,
+                )
+                bar = _BatchedProgress(progress, task)
+
+                for highlight in highlights:
+                    slug = self._deduplicate_slug(highlight.slug, used_slugs)
+                    target_dir = highlights_dir / slug
+                    target_dir.mkdir(exist_ok=True)
 
-                    if self.skip_existing and filepath.exists():
-                        skipped_count += 1
-                        progress.advance(task)
-                        continue
-
-                    try:
-                        self.client.download_media(item.url, filepath)
-                        downloaded_count += 1
-                        self.archive.add(item.media_id)
-                    except DownloadError as e:
-                        if not self.quiet:
-                            console.print(f"[red]Failed to download {item.media_id}: {e}[/red]")
-
-                    progress.advance(task)
+                    if not self.quiet:
+                        console.print(
+                            f"[dim]Highlight: {highlight.title!r} -> {slug}/ "
+                            f"({highlight.media_count} items)[/dim]"
+                        )
+
+                    # Simulate tapping on a highlight
+                    self.client.behavior.highlight_switch_delay()
+
+                    # Fetch items for this highlight
+                    items = self.client.get_highlight_items(highlight.highlight_id)
+
+                    for item in items:
+                        # Skip if in archive
+                        if item.media_id.encode() in archived:
+                            skipped_count += 1
+                            bar.advance()
+                            continue
+
+                        filename = self._get_highlight_filename(username, item)
+                        filepath = target_dir / filename
+
+                        if self.skip_existing and filename in self._existing_names(target_dir):
+                            skipped_count += 1
+                            bar.advance()
+                            continue
+
+                        try:
+                            if self._download_with_etag(item.url, filepath):
+                                downloaded_count += 1
+                                self._existing_names(target_dir).add(filename)
+                            else:
+                                skipped_count += 1
+                            pending.append(item.media_id)
+                            if len(pending) >= ARCHIVE_FLUSH_INTERVAL:
+                                self._archive_pending(pending)
+                        except DownloadError as e:
+                            if not self.quiet:
+                                console.print(f"[red]Failed to download {item.media_id}: {e}[/red]")
+
+                        bar.advance()
+
+                bar.flush()
+        finally:
+            self._archive_pending(pending)
+            self._save_etags()
 
         if not self.quiet:
             console.print(
@@ -481,35 +733,57 @@ class Downloader:
         username: str,
         highlights: list[Highlight],
     ) -> tuple[int, int]:
-        """Download highlights using aria2c batch downloads."""
+        """Download highlights using aria2c batch downloads.
+
+        All highlights share one queue; each item carries its highlight's
+        directory, so aria2c is started once per batch rather than once
+        per highlight.
+        """
         downloaded_count = 0
         skipped_count = 0
-        used_slugs: set[str] = set()
-
-        # Map media_id -> target_dir so aria2 knows where to save each file
-        # aria2 downloads all to one dir, so we use a staging approach:
-        # collect all items, flush per highlight to its own target_dir.
+        used_slugs: dict[str, int] = {}
+        highlights_dir = self.output_dir / username / "highlights"
+        # Parents are created once; each highlight then needs a single mkdir
+        self._ensure_dir(highlights_dir)
+        batch_name = f"{username}_hl"
+        archived = self.archive.snapshot()
+
+        aria2 = Aria2Downloader(
+            output_dir=highlights_dir,
+            quiet=self.quiet,
+            skip_predicate=self.archive.contains,
+        )
+
+        # Try to resume an interrupted batch first
+        resumed, _ = aria2.resume(batch_name)
+        if resumed > 0 and not self.quiet:
+            console.print(f"[green]Resumed {resumed} files[/green]")
 
         total_items = sum(h.media_count for h in highlights)
 
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeRemainingColumn(),
-            console=console,
-            disable=self.quiet,
-        ) as progress:
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TextColumn("{task.completed}/{task.total}"),
+                TimeRemainingColumn(),
+                console=console,
+                disable=self._hide_progress,
+            ) as progress,
+        ):
             task = progress.add_task(
                 f"[cyan]Highlights {username}",
                 total=total_items,
             )
+            bar = _BatchedProgress(progress, task)
+            next_items = executor.submit(self._fetch_highlight_items, highlights[0])
 
-            for highlight in highlights:
+            for idx, highlight in enumerate(highlights):
                 slug = self._deduplicate_slug(highlight.slug, used_slugs)
-                target_dir = self.output_dir / username / "highlights" / slug
-                self._ensure_dir(target_dir)
+                target_dir = highlights_dir / slug
+                target_dir.mkdir(exist_ok=True)
 
                 if not self.quiet:
                     console.print(
@@ -517,41 +791,42 @@ class Downloader:
                         f"({highlight.media_count} items)[/dim]"
                     )
 
-                # Simulate tapping on a highlight
-                self.client.behavior.highlight_switch_delay()
-
-                # Fetch items for this highlight
-                items = self.client.get_highlight_items(highlight.highlight_id)
-
-                aria2 = Aria2Downloader(output_dir=target_dir, quiet=self.quiet)
+                items = next_items.result()
+                # Fetch the next highlight while this one is queued and downloaded
+                if idx + 1 < len(highlights):
+                    next_items = executor.submit(self._fetch_highlight_items, highlights[idx + 1])
 
                 for item in items:
-                    if item.media_id in self.archive:
+                    if item.media_id.encode() in archived:
                         skipped_count += 1
-                        progress.advance(task)
+                        bar.advance()
                         continue
 
                     filename = self._get_highlight_filename(username, item)
-                    filepath = target_dir / filename
 
-                    if self.skip_existing and filepath.exists():
+                    if self.skip_existing and filename in self._existing_names(target_dir):
                         skipped_count += 1
-                        progress.advance(task)
+                        bar.advance()
                         continue
 
                     aria2.add(
                         url=item.url,
                         filename=filename,
                         shortcode=item.media_id,
+                        directory=target_dir,
                     )
-                    progress.advance(task)
+                    bar.advance()
 
-                # Flush this highlight's batch
-                if len(aria2) > 0:
-                    successful_ids, failed = aria2.flush(f"{username}_hl_{slug}")
-                    for media_id in successful_ids:
-                        self.archive.add(media_id)
-                        downloaded_count += 1
+                # Flush when the batch is large enough (CDN URLs expire)
+                if len(aria2) >= ARIA2_BATCH_SIZE:
+                    bar.flush()
+                    downloaded_count += self._flush_highlights_batch(aria2, batch_name)
+
+            bar.flush()
+
+        # Flush remaining items
+        if len(aria2) > 0:
+            downloaded_count += self._flush_highlights_batch(aria2, batch_name)
 
         if not self.quiet:
             console.print(
@@ -559,3 +834,21 @@ class Downloader:
             )
 
         return downloaded_count, skipped_count
+
+    def _fetch_highlight_items(self, highlight: Highlight) -> list[HighlightItem]:
+        """Fetch items for a highlight after the simulated tap delay."""
+        self.client.behavior.highlight_switch_delay()
+        return self.client.get_highlight_items(highlight.highlight_id)
+
+    def _flush_highlights_batch(self, aria2: Aria2Downloader, batch_name: str) -> int:
+        """Download queued highlight items and archive the successful ones.
+
+        Returns:
+            Number of items downloaded
+        """
+        successful_ids, _ = aria2.flush(batch_name)
+        # Items span several highlight directories; rescan them on next use
+        self._existing_cache.clear()
+        self.archive.add_many(successful_ids)
+        self.archive.flush()
+        return len(successful_ids)
@@ -1,13 +1,43 @@
 """Data models for Instagram content."""
 
 import re
+import sys
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import methodcaller
 from typing import Any
 
+# Shared read-only defaults for chained .get() lookups on API payloads;
+# avoids allocating a fresh {} / [] per missing key. Never mutate these.
+_EMPTY_DICT: dict[str, Any] = {}
+_EMPTY_SEQ: tuple[Any, ...] = ()
 
-@dataclass
+# edge -> edge.get("node", _EMPTY_DICT), callable from map() without a Python frame
+_get_node = methodcaller("get", "node", _EMPTY_DICT)
+
+# Post typenames. Values parsed from GraphQL are interned so thousands of
+# posts share three string objects and comparisons hit the identity fast path.
+_GRAPH_IMAGE = sys.intern("GraphImage")
+_GRAPH_VIDEO = sys.intern("GraphVideo")
+_GRAPH_SIDECAR = sys.intern("GraphSidecar")
+
+# REST API media_type: 1=photo, 2=video, 8=carousel
+_TYPENAME_BY_MEDIA_TYPE = {1: _GRAPH_IMAGE, 2: _GRAPH_VIDEO, 8: _GRAPH_SIDECAR}
+
+
+@lru_cache(maxsize=1024)
+def _utc_datetime(timestamp: float) -> datetime:
+    """Convert a Unix timestamp to an aware UTC datetime.
+
+    Cached: carousel children and re-fetched pages repeat the same
+    timestamps, and datetimes are immutable so instances can be shared.
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+@dataclass(slots=True)
 class Profile:
     """Instagram user profile."""
 
@@ -28,15 +58,19 @@ class Profile:
             username=user.get("username", ""),
             full_name=user.get("full_name", ""),
             is_private=user.get("is_private", False),
-            post_count=user.get("edge_owner_to_timeline_media", {}).get("count", 0),
+            post_count=user.get("edge_owner_to_timeline_media", _EMPTY_DICT).get("count", 0),
             biography=user.get("biography", ""),
             profile_pic_url=user.get("profile_pic_url_hd", user.get("profile_pic_url", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MediaItem:
-    """Single media item (image or video)."""
+    """Single media item (image or video).
+
+    Frozen, so items are hashable by (url, is_video, index) and can be
+    deduplicated in sets or used as dict keys.
+    """
 
     url: str
     is_video: bool
@@ -48,7 +82,7 @@ class MediaItem:
         return "mp4" if self.is_video else "jpg"
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """Instagram post with media."""
 
@@ -71,7 +105,7 @@ class Post:
     @property
     def is_carousel(self) -> bool:
         """Check if post is a carousel (multiple media items)."""
-        return self.typename == "GraphSidecar"
+        return self.typename == _GRAPH_SIDECAR
 
     def get_media_items(self) -> list[MediaItem]:
         """Get all media items for download."""
@@ -96,117 +130,104 @@ class Post:
         """Create Post from GraphQL node."""
         # Parse timestamp (Instagram returns Unix timestamp in UTC)
         timestamp_raw = node.get("taken_at_timestamp") or node.get("date", 0)
-        timestamp = datetime.fromtimestamp(timestamp_raw, tz=timezone.utc)
+        timestamp = _utc_datetime(timestamp_raw)
 
         # Parse caption
         caption = ""
-        caption_edges = node.get("edge_media_to_caption", {}).get("edges", [])
+        caption_edges = node.get("edge_media_to_caption", _EMPTY_DICT).get("edges", _EMPTY_SEQ)
         if caption_edges:
-            caption = caption_edges[0].get("node", {}).get("text", "")
+            caption = caption_edges[0].get("node", _EMPTY_DICT).get("text", "")
 
         # Parse media items for carousel
         media_items: list[MediaItem] = []
-        sidecar_edges = node.get("edge_sidecar_to_children", {}).get("edges", [])
-        for idx, edge in enumerate(sidecar_edges):
-            child = edge.get("node", {})
+        sidecar_edges = node.get("edge_sidecar_to_children", _EMPTY_DICT).get("edges", _EMPTY_SEQ)
+        append = media_items.append
+        for index, edge in enumerate(sidecar_edges, start=1):
+            child = edge.get("node", _EMPTY_DICT)
             is_video = child.get("is_video", False)
-            media_items.append(
-                MediaItem(
-                    url=child.get("video_url") if is_video else child.get("display_url", ""),
-                    is_video=is_video,
-                    index=idx + 1,
-                )
-            )
-
-        return cls(
-            shortcode=node.get("shortcode", ""),
-            typename=node.get("__typename", "GraphImage"),
-            display_url=node.get("display_url", ""),
-            video_url=node.get("video_url"),
-            is_video=node.get("is_video", False),
-            timestamp=timestamp,
-            caption=caption,
-            like_count=node.get("edge_media_preview_like", {}).get("count", 0),
-            comment_count=node.get("edge_media_to_comment", {}).get("count", 0),
-            media_items=media_items,
-        )
+            url = child.get("video_url") if is_video else child.get("display_url", "")
+            # Positional: keyword calls are noticeably slower in this loop
+            append(MediaItem(url, is_video, index))
+
+        # Fill slots directly: skips the keyword-argument __init__ call,
+        # which dominates construction cost when parsing whole pages
+        post = object.__new__(cls)
+        post.shortcode = node.get("shortcode", "")
+        post.typename = sys.intern(node.get("__typename") or _GRAPH_IMAGE)
+        post.display_url = node.get("display_url", "")
+        post.video_url = node.get("video_url")
+        post.is_video = node.get("is_video", False)
+        post.timestamp = timestamp
+        post.caption = caption
+        post.like_count = node.get("edge_media_preview_like", _EMPTY_DICT).get("count", 0)
+        post.comment_count = node.get("edge_media_to_comment", _EMPTY_DICT).get("count", 0)
+        post.media_items = media_items
+        return post
 
     @classmethod
     def from_rest_item(cls, item: dict[str, Any]) -> "Post":
         """Create Post from REST API item (/api/v1/feed/user/)."""
         # Parse timestamp
         timestamp_raw = item.get("taken_at", 0)
-        timestamp = datetime.fromtimestamp(timestamp_raw, tz=timezone.utc)
+        timestamp = _utc_datetime(timestamp_raw)
 
         # Parse caption
-        caption_data = item.get("caption") or {}
+        caption_data = item.get("caption") or _EMPTY_DICT
         caption = caption_data.get("text", "") if isinstance(caption_data, dict) else ""
 
-        # Media type: 1=photo, 2=video, 8=carousel
-        media_type = item.get("media_type", 1)
-        is_video = media_type == 2
-        is_carousel = media_type == 8
-
-        # Map media_type to typename
-        typename = "GraphImage"
-        if is_video:
-            typename = "GraphVideo"
-        elif is_carousel:
-            typename = "GraphSidecar"
+        # Map media_type to typename (unknown types are treated as photos)
+        typename = _TYPENAME_BY_MEDIA_TYPE.get(item.get("media_type", 1), _GRAPH_IMAGE)
+        is_video = typename is _GRAPH_VIDEO
 
         # Get display URL
         display_url = ""
-        image_versions = item.get("image_versions2", {}).get("candidates", [])
+        image_versions = item.get("image_versions2", _EMPTY_DICT).get("candidates", _EMPTY_SEQ)
         if image_versions:
             display_url = image_versions[0].get("url", "")
 
         # Get video URL
         video_url = None
         if is_video:
-            video_versions = item.get("video_versions", [])
+            video_versions = item.get("video_versions", _EMPTY_SEQ)
             if video_versions:
                 video_url = video_versions[0].get("url")
 
         # Parse carousel items
         media_items: list[MediaItem] = []
-        carousel_media = item.get("carousel_media", [])
-        for idx, child in enumerate(carousel_media):
+        carousel_media = item.get("carousel_media", _EMPTY_SEQ)
+        append = media_items.append
+        for index, child in enumerate(carousel_media, start=1):
             child_is_video = child.get("media_type") == 2
             child_url = ""
 
             if child_is_video:
-                video_vers = child.get("video_versions", [])
+                video_vers = child.get("video_versions", _EMPTY_SEQ)
                 if video_vers:
                     child_url = video_vers[0].get("url", "")
             else:
-                img_vers = child.get("image_versions2", {}).get("candidates", [])
+                img_vers = child.get("image_versions2", _EMPTY_DICT).get("candidates", _EMPTY_SEQ)
                 if img_vers:
                     child_url = img_vers[0].get("url", "")
 
             if child_url:
-                media_items.append(
-                    MediaItem(
-                        url=child_url,
-                        is_video=child_is_video,
-                        index=idx + 1,
-                    )
-                )
-
-        return cls(
-            shortcode=item.get("code", ""),
-            typename=typename,
-            display_url=display_url,
-            video_url=video_url,
-            is_video=is_video,
-            timestamp=timestamp,
-            caption=caption,
-            like_count=item.get("like_count", 0),
-            comment_count=item.get("comment_count", 0),
-            media_items=media_items,
-        )
-
-
-@dataclass
+                append(MediaItem(child_url, child_is_video, index))
+
+        # Fill slots directly (see from_node)
+        post = object.__new__(cls)
+        post.shortcode = item.get("code", "")
+        post.typename = typename
+        post.display_url = display_url
+        post.video_url = video_url
+        post.is_video = is_video
+        post.timestamp = timestamp
+        post.caption = caption
+        post.like_count = item.get("like_count", 0)
+        post.comment_count = item.get("comment_count", 0)
+        post.media_items = media_items
+        return post
+
+
+@dataclass(slots=True)
 class PostsPage:
     """Paginated response of posts."""
 
@@ -217,11 +238,11 @@ class PostsPage:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> "PostsPage":
         """Create PostsPage from Instagram API response."""
-        media = data.get("edge_owner_to_timeline_media", {})
-        edges = media.get("edges", [])
-        page_info = media.get("page_info", {})
+        media = data.get("edge_owner_to_timeline_media", _EMPTY_DICT)
+        edges = media.get("edges", _EMPTY_SEQ)
+        page_info = media.get("page_info", _EMPTY_DICT)
 
-        posts = [Post.from_node(edge.get("node", {})) for edge in edges]
+        posts = list(map(Post.from_node, map(_get_node, edges)))
 
         return cls(
             posts=posts,
@@ -232,8 +253,8 @@ class PostsPage:
     @classmethod
     def from_rest_response(cls, data: dict[str, Any]) -> "PostsPage":
         """Create PostsPage from REST API response (/api/v1/feed/user/)."""
-        items = data.get("items", [])
-        posts = [Post.from_rest_item(item) for item in items]
+        items = data.get("items", _EMPTY_SEQ)
+        posts = list(map(Post.from_rest_item, items))
 
         return cls(
             posts=posts,
@@ -242,6 +263,12 @@ class PostsPage:
         )
 
 
+# Runs of whitespace, hyphens and filesystem-unsafe characters
+# (/ \ NUL and control characters 0x00-0x1F, 0x7F); each run becomes one hyphen
+_hyphenate = re.compile(r"[\s\x00-\x1f\x7f/\\-]+").sub
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe directory name.
 
@@ -256,24 +283,27 @@ def slugify(text: str) -> str:
         "Café & Bar" -> "café-&-bar"
         "🔗" -> "🔗"
         "Море" -> "море"
+
+    Results are cached: the same titles recur across profiles and re-runs.
     """
-    # Normalize unicode to NFC (composed form, consistent representation)
-    text = unicodedata.normalize("NFC", text)
+    if text.isascii():
+        # Single-word ASCII titles ("Travel", "2024") need no substitution
+        if text.isalnum():
+            return text.lower()
+    else:
+        # Normalize unicode to NFC (composed form, consistent representation);
+        # ASCII text is already NFC, so it skips this
+        text = unicodedata.normalize("NFC", text)
     # Lowercase (only affects cased characters, emoji/symbols unchanged)
     text = text.lower()
-    # Replace filesystem-unsafe characters and whitespace with hyphens
-    # Unsafe: / \ NUL and control characters (0x00-0x1F, 0x7F)
-    text = re.sub(r"[\x00-\x1f\x7f/\\]+", "-", text)
-    # Replace whitespace with hyphens
-    text = re.sub(r"\s+", "-", text)
-    # Collapse consecutive hyphens
-    text = re.sub(r"-{2,}", "-", text)
+    # Replace whitespace and unsafe characters with hyphens, collapsing runs
+    text = _hyphenate("-", text)
     # Strip leading/trailing hyphens and dots (avoid hidden dirs)
     text = text.strip("-.")
     return text or "untitled"
 
 
-@dataclass
+@dataclass(slots=True)
 class HighlightItem:
     """Single item (photo or video) from a highlight reel."""
 
@@ -301,16 +331,16 @@ class HighlightItem:
         media_type = item.get("media_type", 1)
         is_video = media_type == 2
         timestamp_raw = item.get("taken_at", 0)
-        timestamp = datetime.fromtimestamp(timestamp_raw, tz=timezone.utc)
+        timestamp = _utc_datetime(timestamp_raw)
 
         # Select best quality URL
         url = ""
         if is_video:
-            video_versions = item.get("video_versions", [])
+            video_versions = item.get("video_versions", _EMPTY_SEQ)
             if video_versions:
                 url = video_versions[0].get("url", "")
         else:
-            image_versions = item.get("image_versions2", {}).get("candidates", [])
+            image_versions = item.get("image_versions2", _EMPTY_DICT).get("candidates", _EMPTY_SEQ)
             if image_versions:
                 url = image_versions[0].get("url", "")
 
@@ -322,7 +352,7 @@ class HighlightItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Highlight:
     """Instagram highlight reel.
 
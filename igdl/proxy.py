@@ -1,5 +1,6 @@
 """Proxy management and rotation for Instagram requests."""
 
+import itertools
 import random
 from pathlib import Path
 from threading import Lock
@@ -35,7 +36,9 @@ class ProxyRotator:
         """
         self._quiet = quiet
         self._lock = Lock()
-        self._request_count = 0
+        # next() on itertools.count is atomic under the GIL, so counting
+        # requests needs no lock; replacing it resets the count
+        self._request_counter = itertools.count(1)
         self._current_index = 0
 
         # Load proxies
@@ -47,25 +50,38 @@ class ProxyRotator:
             if self._proxies:
                 random.shuffle(self._proxies)
 
+        # requests-style proxy mapping per proxy, built once (same order)
+        self._proxy_dicts = [{"http": p, "https": p} for p in self._proxies]
+
     def _load_proxy_file(self, path: Path) -> list[str]:
         """Load proxies from file (one URL per line)."""
-        if not path.exists():
+        try:
+            data = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             if not self._quiet:
                 console.print(f"[yellow]Proxy file not found: {path}[/yellow]")
             return []
 
-        proxies: list[str] = []
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                proxy = line.strip()
-                if proxy and not proxy.startswith("#"):
-                    proxies.append(proxy)
+        # Single read + C-level split; skip blank lines and comments
+        proxies = [
+            proxy
+            for proxy in (line.strip() for line in data.splitlines())
+            if proxy and not proxy.startswith("#")
+        ]
 
         if not self._quiet and proxies:
             console.print(f"[dim]Loaded {len(proxies)} proxies[/dim]")
 
         return proxies
 
+    def __len__(self) -> int:
+        """Return number of loaded proxies."""
+        return len(self._proxies)
+
+    def __bool__(self) -> bool:
+        """Rotator is always truthy, even without proxies."""
+        return True
+
     @property
     def enabled(self) -> bool:
         """Check if proxy rotation is enabled."""
@@ -77,29 +93,32 @@ class ProxyRotator:
         return len(self._proxies) > 1
 
     def get_current(self) -> str | None:
-        """Get current proxy URL."""
-        if not self._proxies:
-            return None
-        with self._lock:
-            return self._proxies[self._current_index]
+        """Get current proxy URL.
+
+        Lock-free: the index is only replaced whole by _rotate(), so a read
+        racing a rotation sees either the old or the new proxy, both valid.
+        """
+        proxies = self._proxies
+        return proxies[self._current_index] if proxies else None
 
     def get_proxies_dict(self) -> dict[str, str] | None:
-        """Get proxy dict for requests library."""
-        proxy = self.get_current()
-        if not proxy:
-            return None
-        return {"http": proxy, "https": proxy}
+        """Get proxy dict for requests library.
+
+        The same dict is returned for every request through a proxy.
+        requests may setdefault() environment proxy keys into it, but never
+        overrides the http/https entries, so sharing it is safe.
+        """
+        proxy_dicts = self._proxy_dicts
+        return proxy_dicts[self._current_index] if proxy_dicts else None
 
     def record_request(self) -> None:
         """Record a request and rotate if threshold reached."""
         if not self.has_multiple:
             return
 
-        with self._lock:
-            self._request_count += 1
-            if self._request_count >= self.ROTATE_EVERY_REQUESTS:
+        if next(self._request_counter) % self.ROTATE_EVERY_REQUESTS == 0:
+            with self._lock:
                 self._rotate()
-                self._request_count = 0
 
     def rotate_on_error(self) -> None:
         """Force rotation due to rate limit or error."""
@@ -108,7 +127,7 @@ class ProxyRotator:
 
         with self._lock:
             self._rotate()
-            self._request_count = 0
+            self._request_counter = itertools.count(1)
 
     def _rotate(self) -> None:
         """Switch to next proxy in the list."""
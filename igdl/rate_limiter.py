@@ -3,6 +3,7 @@
 import random
 import time
 from collections import deque
+from dataclasses import dataclass, field
 from threading import Lock
 
 from rich.console import Console
@@ -10,12 +11,25 @@ from rich.console import Console
 console = Console()
 
 
+@dataclass
+class _HostWindow:
+    """Sliding window state for a single host."""
+
+    timestamps: deque[float] = field(default_factory=deque)
+    lock: Lock = field(default_factory=Lock)
+    # Monotonic time at which the last reserved request may start
+    next_slot: float = 0.0
+
+
 class RateLimiter:
     """Sliding window rate limiter for Instagram API.
 
     Based on instaloader's research:
     - 75 requests per 11 minutes for anonymous users (conservative)
     - Random delay between requests using exponential distribution
+
+    Each host gets its own window and lock, so waiting on one host never
+    blocks requests to another.
     """
 
     WINDOW_SECONDS: float = 660.0  # 11 minutes
@@ -27,63 +41,145 @@ class RateLimiter:
     AGGRESSIVE_MIN_DELAY: float = 0.1
     AGGRESSIVE_MAX_DELAY: float = 0.3
 
+    # Random delays are drawn in batches; each is used once, never replayed
+    DELAY_BATCH_SIZE: int = 256
+
+    # Adaptive retry budget: throttled responses spend tokens, successes and
+    # elapsed time earn them back. An empty bucket means stop retrying.
+    RETRY_BUCKET_CAPACITY: float = 10.0
+    RETRY_BUCKET_FILL_RATE: float = 0.5  # tokens per second
+    RETRY_SUCCESS_REFUND: float = 0.1
+    RETRY_THROTTLE_COST: float = 1.0
+
     def __init__(self, quiet: bool = False, has_proxy: bool = False) -> None:
-        self._timestamps: deque[float] = deque()
+        self._windows: dict[str, _HostWindow] = {}
         self._lock = Lock()
         self._quiet = quiet
         self._has_proxy = has_proxy
-
-    def _clean_old_timestamps(self, current_time: float) -> None:
+        self._retry_tokens = self.RETRY_BUCKET_CAPACITY
+        self._retry_refilled_at = time.monotonic()
+        self._delays: list[float] = []
+
+    def _window(self, host: str) -> _HostWindow:
+        """Get (or create) the sliding window for host."""
+        window = self._windows.get(host)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(host, _HostWindow())
+        return window
+
+    def _clean_old_timestamps(self, timestamps: deque[float], current_time: float) -> None:
         """Remove timestamps outside the sliding window."""
         cutoff = current_time - self.WINDOW_SECONDS
-        while self._timestamps and self._timestamps[0] < cutoff:
-            self._timestamps.popleft()
+        while timestamps and timestamps[0] < cutoff:
+            timestamps.popleft()
 
-    def _random_delay(self) -> float:
-        """Generate random delay using exponential distribution."""
+    def _draw_delays(self) -> list[float]:
+        """Draw a batch of random delays from the configured distribution."""
+        n = self.DELAY_BATCH_SIZE
         if self._has_proxy:
             # With proxy: minimal delay
-            return random.uniform(self.AGGRESSIVE_MIN_DELAY, self.AGGRESSIVE_MAX_DELAY)
+            uniform = random.uniform
+            low, high = self.AGGRESSIVE_MIN_DELAY, self.AGGRESSIVE_MAX_DELAY
+            return [uniform(low, high) for _ in range(n)]
         # Lambda = 0.3 gives mean delay of ~3.3s (more conservative)
-        delay = min(random.expovariate(0.3), self.MAX_DELAY)
-        return max(delay, self.MIN_DELAY)
+        expovariate = random.expovariate
+        low, high = self.MIN_DELAY, self.MAX_DELAY
+        return [max(min(expovariate(0.3), high), low) for _ in range(n)]
 
-    def wait_if_needed(self) -> None:
-        """Wait if approaching rate limit, then add random delay."""
+    def _random_delay(self) -> float:
+        """Get the next random delay, redrawing a fresh batch when used up."""
         with self._lock:
+            if not self._delays:
+                self._delays = self._draw_delays()
+            return self._delays.pop()
+
+    def wait_if_needed(self, host: str = "") -> None:
+        """Wait if approaching rate limit for host, then add random delay.
+
+        The wait is reserved under the host lock but slept outside it, so
+        record_request() and other waiters are never blocked by a sleeper.
+        Concurrent callers queue behind each other's reserved slots, which
+        keeps requests to one host spaced as if they were sequential.
+
+        Args:
+            host: Host (URL netloc) the next request goes to
+        """
+        window = self._window(host)
+        limit_wait = 0.0
+        with window.lock:
+            current_time = time.monotonic()
+
             # With proxy, skip sliding window check (IP rotates)
             if not self._has_proxy:
-                current_time = time.monotonic()
-                self._clean_old_timestamps(current_time)
-
-                requests_in_window = len(self._timestamps)
+                self._clean_old_timestamps(window.timestamps, current_time)
 
                 # If at limit, wait until oldest request expires
-                if requests_in_window >= self.MAX_REQUESTS:
-                    oldest = self._timestamps[0]
-                    wait_time = oldest + self.WINDOW_SECONDS - current_time + 6.0
-                    if wait_time > 0:
-                        if not self._quiet:
-                            msg = f"Rate limit approaching, waiting {wait_time:.1f}s..."
-                            console.print(f"[yellow]{msg}[/yellow]")
-                        time.sleep(wait_time)
+                if len(window.timestamps) >= self.MAX_REQUESTS:
+                    oldest = window.timestamps[0]
+                    limit_wait = oldest + self.WINDOW_SECONDS - current_time + 6.0
 
+            # Start after any slot already reserved by a concurrent caller
+            wait_time = max(limit_wait, window.next_slot - current_time, 0.0)
             # Add random delay to avoid detection
             delay = self._random_delay()
-            time.sleep(delay)
-
-    def record_request(self) -> None:
-        """Record that a request was made."""
+            window.next_slot = current_time + wait_time + delay
+
+        if wait_time > 0:
+            if limit_wait > 0 and not self._quiet:
+                msg = f"Rate limit approaching, waiting {wait_time:.1f}s..."
+                console.print(f"[yellow]{msg}[/yellow]")
+            time.sleep(wait_time)
+        time.sleep(delay)
+
+    def record_request(self, host: str = "") -> None:
+        """Record that a request was made to host."""
+        window = self._window(host)
+        with window.lock:
+            window.timestamps.append(time.monotonic())
+
+    def _refill_retry_tokens(self, current_time: float) -> None:
+        """Add retry tokens earned since the last refill."""
+        elapsed = current_time - self._retry_refilled_at
+        self._retry_tokens = min(
+            self.RETRY_BUCKET_CAPACITY,
+            self._retry_tokens + elapsed * self.RETRY_BUCKET_FILL_RATE,
+        )
+        self._retry_refilled_at = current_time
+
+    def on_success(self) -> None:
+        """Record a successful response, refunding part of the retry budget."""
+        with self._lock:
+            self._refill_retry_tokens(time.monotonic())
+            self._retry_tokens = min(
+                self.RETRY_BUCKET_CAPACITY,
+                self._retry_tokens + self.RETRY_SUCCESS_REFUND,
+            )
+
+    def on_throttle(self) -> bool:
+        """Record a throttled response and spend retry budget.
+
+        Returns:
+            True if a retry is still allowed, False if the budget is exhausted
+        """
         with self._lock:
-            self._timestamps.append(time.monotonic())
+            self._refill_retry_tokens(time.monotonic())
+            self._retry_tokens -= self.RETRY_THROTTLE_COST
+            return self._retry_tokens > 0
 
     def get_stats(self) -> dict[str, int | float]:
         """Get current rate limiter statistics."""
+        current_time = time.monotonic()
+        requests_in_window = 0
+        for window in list(self._windows.values()):
+            with window.lock:
+                self._clean_old_timestamps(window.timestamps, current_time)
+                requests_in_window += len(window.timestamps)
+
         with self._lock:
-            current_time = time.monotonic()
-            self._clean_old_timestamps(current_time)
             return {
-                "requests_in_window": len(self._timestamps),
+                "requests_in_window": requests_in_window,
                 "max_requests": self.MAX_REQUESTS,
                 "window_seconds": self.WINDOW_SECONDS,
+                "retry_tokens": self._retry_tokens,
             }
@@ -0,0 +1,104 @@
+"""Tests for igdl download archive."""
+
+from pathlib import Path
+
+from igdl.archive import DownloadArchive
+
+
+class TestDownloadArchive:
+    """Tests for DownloadArchive."""
+
+    def test_disabled_archive(self) -> None:
+        archive = DownloadArchive(None)
+        archive.add("ABC123")
+
+        assert not archive.enabled
+        assert "ABC123" in archive
+        archive.flush()
+        archive.close()
+
+    def test_add_and_flush_persists(self, tmp_path: Path) -> None:
+        path = tmp_path / "sub" / "archive.txt"
+        archive = DownloadArchive(path)
+        archive.add("ABC123")
+        archive.add("XYZ789")
+        archive.add("ABC123")
+        archive.flush()
+
+        assert path.read_text(encoding="utf-8") == "ABC123\nXYZ789\n"
+        archive.close()
+
+    def test_reload_from_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "archive.txt"
+        with DownloadArchive(path) as archive:
+            archive.add("ABC123")
+            archive.add("XYZ789")
+
+        reloaded = DownloadArchive(path)
+
+        assert len(reloaded) == 2
+        assert "ABC123" in reloaded
+        assert "XYZ789" in reloaded
+        assert "missing" not in reloaded
+
+    def test_load_skips_blank_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "archive.txt"
+        path.write_text("ABC123\n\nXYZ789\n", encoding="utf-8")
+
+        archive = DownloadArchive(path)
+
+        assert len(archive) == 2
+
+    def test_missing_file_is_empty(self, tmp_path: Path) -> None:
+        archive = DownloadArchive(tmp_path / "missing.txt")
+
+        assert len(archive) == 0
+        assert archive.enabled
+
+    def test_add_many(self, tmp_path: Path) -> None:
+        path = tmp_path / "archive.txt"
+        with DownloadArchive(path) as archive:
+            archive.add("ABC123")
+            archive.add_many(["ABC123", "XYZ789", "XYZ789", "QWE456"])
+
+        assert path.read_text(encoding="utf-8") == "ABC123\nXYZ789\nQWE456\n"
+        assert len(DownloadArchive(path)) == 3
+
+    def test_add_many_in_background(self, tmp_path: Path) -> None:
+        path = tmp_path / "archive.txt"
+        with DownloadArchive(path) as archive:
+            archive.add("ABC123")
+            archive.add_many_in_background(["ABC123", "XYZ789"])
+            archive.add_many_in_background(["QWE456"])
+
+            # Visible before the writer thread gets to it
+            assert "XYZ789" in archive
+            assert "QWE456" in archive
+            archive.flush()
+            assert path.read_text(encoding="utf-8") == "ABC123\nXYZ789\nQWE456\n"
+
+    def test_add_many_in_background_disabled(self) -> None:
+        archive = DownloadArchive(None)
+        archive.add_many_in_background(["ABC123"])
+
+        assert "ABC123" in archive
+        assert archive._writer is None
+        archive.close()
+
+    def test_snapshot_is_immutable_copy(self) -> None:
+        archive = DownloadArchive(None)
+        archive.add("ABC123")
+        snapshot = archive.snapshot()
+        archive.add("XYZ789")
+
+        assert snapshot == frozenset({b"ABC123"})
+
+    def test_snapshot_shares_stored_keys(self, tmp_path: Path) -> None:
+        path = tmp_path / "archive.txt"
+        path.write_text("ABC123\n", encoding="utf-8")
+        archive = DownloadArchive(path)
+
+        (stored,) = archive._downloaded
+        (shared,) = archive.snapshot()
+
+        assert shared is stored
@@ -0,0 +1,297 @@
+"""Tests for igdl aria2c batch downloader."""
+
+from pathlib import Path
+
+import pytest
+
+from igdl import aria2 as aria2_module
+from igdl.aria2 import Aria2Downloader
+
+
+class TestAria2InputFile:
+    """Tests for aria2c input file handling."""
+
+    def test_write_input_file(self, tmp_path: Path) -> None:
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+        aria2.add("https://cdn.example/b.mp4", "user_XYZ_1.mp4", "XYZ")
+
+        input_file = tmp_path / ".user.aria2.txt"
+        aria2._write_input_file(input_file)
+
+        assert input_file.read_text(encoding="utf-8") == (
+            "# shortcode=ABC\n"
+            "https://cdn.example/a.jpg\n"
+            "  out=user_ABC.jpg\n"
+            "# shortcode=XYZ\n"
+            "https://cdn.example/b.mp4\n"
+            "  out=user_XYZ_1.mp4\n"
+        )
+
+    def test_shortcodes(self, tmp_path: Path) -> None:
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        aria2.add("https://cdn.example/a.jpg", "user_ABC_1.jpg", "ABC")
+        aria2.add("https://cdn.example/b.jpg", "user_ABC_2.jpg", "ABC")
+
+        assert len(aria2) == 2
+        assert aria2.shortcodes == {"ABC"}
+
+        aria2.clear()
+
+        assert len(aria2) == 0
+        assert aria2.shortcodes == set()
+
+    def test_resume_parses_input_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        input_file = tmp_path / ".user.aria2.txt"
+        input_file.write_text(
+            "# shortcode=ABC\n"
+            "https://cdn.example/a.jpg\n"
+            "  out=user_ABC.jpg\n"
+            "# shortcode=X_YZ\n"
+            "https://cdn.example/b.mp4\n"
+            "  out=user_X_YZ_1.mp4\n",
+            encoding="utf-8",
+        )
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        parsed: list[tuple[str, str, str]] = []
+
+        def fake_run(path: Path) -> tuple[int, int]:
+            parsed.extend((i.url, i.filename, i.shortcode) for i in aria2._items)
+            return len(parsed), 0
+
+        monkeypatch.setattr(aria2, "_run_aria2c", fake_run)
+        successful, failed = aria2.resume("user")
+
+        assert (successful, failed) == (2, 0)
+        assert parsed == [
+            ("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC"),
+            ("https://cdn.example/b.mp4", "user_X_YZ_1.mp4", "X_YZ"),
+        ]
+        assert not input_file.exists()
+
+    def test_resume_runs_filtered_entries_only(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        input_file = tmp_path / ".user.aria2.txt"
+        # Left behind by an interrupted run
+        interrupted = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        interrupted.add("https://cdn.example/a.jpg", "user_ABC_1.jpg", "ABC")
+        interrupted.add("https://cdn.example/b.jpg", "user_OLD_1.jpg", "OLD")
+        interrupted._write_input_file(input_file)
+        aria2 = Aria2Downloader(
+            output_dir=tmp_path, quiet=True, skip_predicate=lambda sc: sc == "OLD"
+        )
+        ran: list[str] = []
+
+        def fake_run(path: Path) -> tuple[int, int]:
+            ran.append(path.read_text(encoding="utf-8"))
+            return 0, 1
+
+        monkeypatch.setattr(aria2, "_run_aria2c", fake_run)
+
+        assert aria2.resume("user") == (0, 1)
+        assert ran == ["# shortcode=ABC\nhttps://cdn.example/a.jpg\n  out=user_ABC_1.jpg\n"]
+
+    def test_flush_reports_existing_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+        aria2.add("https://cdn.example/b.jpg", "user_XYZ.jpg", "XYZ")
+
+        def fake_run(path: Path) -> tuple[int, int]:
+            (tmp_path / "user_ABC.jpg").write_bytes(b"data")
+            return 1, 1
+
+        monkeypatch.setattr(aria2, "_run_aria2c", fake_run)
+        successful, failed = aria2.flush("user")
+
+        assert successful == {"ABC"}
+        assert failed == 1
+        assert len(aria2) == 0
+        assert (tmp_path / ".user.aria2.txt").exists()
+
+    def test_add_deduplicates(self, tmp_path: Path) -> None:
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+
+        assert aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+        assert not aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+        assert len(aria2) == 1
+
+        aria2.clear()
+
+        assert aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+
+    def test_add_skip_predicate(self, tmp_path: Path) -> None:
+        archived = {"ABC"}
+        aria2 = Aria2Downloader(
+            output_dir=tmp_path, quiet=True, skip_predicate=archived.__contains__
+        )
+
+        assert not aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+        assert aria2.add("https://cdn.example/b.jpg", "user_XYZ.jpg", "XYZ")
+        assert aria2.shortcodes == {"XYZ"}
+
+
+class TestAria2Directories:
+    """Tests for per-item target directories."""
+
+    def test_input_file_includes_dir(self, tmp_path: Path) -> None:
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        aria2.add("https://cdn.example/a.jpg", "user_1.jpg", "1", directory=tmp_path / "sea")
+        aria2.add("https://cdn.example/b.jpg", "user_2.jpg", "2")
+
+        input_file = tmp_path / ".user_hl.aria2.txt"
+        aria2._write_input_file(input_file)
+
+        assert input_file.read_text(encoding="utf-8") == (
+            "# shortcode=1\n"
+            "https://cdn.example/a.jpg\n"
+            f"  dir={tmp_path / 'sea'}\n"
+            "  out=user_1.jpg\n"
+            "# shortcode=2\n"
+            "https://cdn.example/b.jpg\n"
+            "  out=user_2.jpg\n"
+        )
+
+    def test_flush_checks_each_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        aria2.add("https://cdn.example/a.jpg", "a.jpg", "A", directory=tmp_path / "one")
+        aria2.add("https://cdn.example/b.jpg", "b.jpg", "B", directory=tmp_path / "two")
+
+        def fake_run(path: Path) -> tuple[int, int]:
+            (tmp_path / "two").mkdir()
+            (tmp_path / "two" / "b.jpg").write_bytes(b"data")
+            return 1, 1
+
+        monkeypatch.setattr(aria2, "_run_aria2c", fake_run)
+        successful, failed = aria2.flush("user_hl")
+
+        assert successful == {"B"}
+        assert failed == 1
+
+    def test_resume_restores_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / ".user_hl.aria2.txt").write_text(
+            "https://cdn.example/a.jpg\n  dir=/data/sea\n  out=A.jpg\n",
+            encoding="utf-8",
+        )
+        aria2 = Aria2Downloader(output_dir=tmp_path, quiet=True)
+        parsed: list[Path | None] = []
+
+        def fake_run(path: Path) -> tuple[int, int]:
+            parsed.extend(item.directory for item in aria2._items)
+            return 1, 0
+
+        monkeypatch.setattr(aria2, "_run_aria2c", fake_run)
+        aria2.resume("user_hl")
+
+        assert parsed == [Path("/data/sea")]
+
+
+class TestAria2Availability:
+    """Tests for aria2c binary lookup."""
+
+    def test_lookup_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+
+        def fake_which(name: str) -> str | None:
+            calls.append(name)
+            return "/usr/bin/aria2c"
+
+        monkeypatch.setattr(aria2_module.shutil, "which", fake_which)
+        aria2_module._find_aria2c.cache_clear()
+        try:
+            assert Aria2Downloader.is_available()
+            assert Aria2Downloader.is_available()
+            assert Aria2Downloader(output_dir=Path("."))._aria2c_path == "/usr/bin/aria2c"
+            assert calls == ["aria2c"]
+        finally:
+            aria2_module._find_aria2c.cache_clear()
+
+
+class TestAria2Output:
+    """Tests for relaying aria2c output."""
+
+    def test_output_relayed_through_console(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import io
+
+        printed: list[str] = []
+        popen_kwargs: dict[str, object] = {}
+        commands: list[list[str]] = []
+
+        class FakePopen:
+            def __init__(self, cmd: list[str], **kwargs: object) -> None:
+                popen_kwargs.update(kwargs)
+                commands.append(cmd)
+                self.stdout = io.StringIO("WARN retrying\n\nDownload complete\n")
+
+            def wait(self) -> int:
+                return 0
+
+        class FakeConsole:
+            def print(self, text: str, **kwargs: object) -> None:
+                printed.append(text)
+
+        monkeypatch.setattr(aria2_module.subprocess, "Popen", FakePopen)
+        monkeypatch.setattr(aria2_module, "console", FakeConsole())
+        aria2 = Aria2Downloader(output_dir=tmp_path)
+        aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+
+        assert aria2._run_aria2c(tmp_path / "input.txt") == (1, 0)
+        assert printed == ["WARN retrying", "Download complete"]
+        assert popen_kwargs["stdout"] is aria2_module.subprocess.PIPE
+        assert "--show-console-readout=false" in commands[0]
+
+    def test_interrupt_terminates_aria2c(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        class InterruptedStdout:
+            def __enter__(self) -> "InterruptedStdout":
+                return self
+
+            def __exit__(self, *args: object) -> None:
+                pass
+
+            def __iter__(self) -> "InterruptedStdout":
+                return self
+
+            def __next__(self) -> str:
+                raise KeyboardInterrupt
+
+        class FakePopen:
+            def __init__(self, cmd: list[str], **kwargs: object) -> None:
+                self.stdout = InterruptedStdout()
+
+            def terminate(self) -> None:
+                calls.append("terminate")
+
+            def wait(self, timeout: float | None = None) -> int:
+                calls.append(f"wait {timeout}")
+                if timeout is not None:
+                    raise aria2_module.subprocess.TimeoutExpired("aria2c", timeout)
+                return -9
+
+            def kill(self) -> None:
+                calls.append("kill")
+
+        monkeypatch.setattr(aria2_module.subprocess, "Popen", FakePopen)
+        aria2 = Aria2Downloader(output_dir=tmp_path)
+        aria2.add("https://cdn.example/a.jpg", "user_ABC.jpg", "ABC")
+
+        with pytest.raises(KeyboardInterrupt):
+            aria2._run_aria2c(tmp_path / "input.txt")
+
+        assert calls == [
+            "terminate",
+            f"wait {aria2_module.TERMINATE_TIMEOUT}",
+            "kill",
+            "wait None",
+        ]
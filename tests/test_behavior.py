@@ -0,0 +1,109 @@
+"""Tests for igdl behavior simulation."""
+
+import pytest
+
+from igdl import behavior
+from igdl.behavior import BehaviorSimulator
+
+
+class FakeClock:
+    """Deterministic replacement for time.monotonic/time.sleep."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(behavior.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(behavior.time, "sleep", fake.sleep)
+    return fake
+
+
+class TestTokenBucket:
+    """Tests for BehaviorSimulator pacing."""
+
+    def test_starts_empty(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+
+        sim.record_post_processed()
+
+        assert clock.sleeps == [pytest.approx(1.0 / sim.BUCKET_REFILL_RATE)]
+
+    def test_refill_rate_caps_at_capacity(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+        clock.now += 10 * sim.BUCKET_CAPACITY / sim.BUCKET_REFILL_RATE
+
+        for _ in range(int(sim.BUCKET_CAPACITY)):
+            sim.record_post_processed()
+        assert clock.sleeps == []
+
+        sim.record_post_processed()
+        assert clock.sleeps == [pytest.approx(1.0 / sim.BUCKET_REFILL_RATE)]
+
+    def test_sleeps_only_for_deficit(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+        clock.now += 0.25 / sim.BUCKET_REFILL_RATE
+
+        sim.record_post_processed()
+
+        assert clock.sleeps == [pytest.approx(0.75 / sim.BUCKET_REFILL_RATE)]
+
+    def test_page_delay_adds_jitter(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+        clock.now += sim.BUCKET_CAPACITY / sim.BUCKET_REFILL_RATE
+
+        sim.page_delay()
+
+        assert len(clock.sleeps) == 1
+        assert sim.PAGE_DELAY_MIN <= clock.sleeps[0] <= sim.PAGE_DELAY_MAX
+
+    def test_steady_state_page_pace(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+        pages = 20
+
+        for _ in range(pages):
+            sim.page_delay()
+            for _ in range(12):
+                sim.record_post_processed()
+
+        # Roughly matches the old 1-3s page delay plus periodic breaks (~5-6s/page)
+        assert 4.0 <= clock.now / pages <= 6.5
+
+    def test_proxy_skips_pacing(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True, has_proxy=True)
+
+        for _ in range(int(sim.BUCKET_CAPACITY) * 2):
+            sim.record_post_processed()
+
+        assert clock.sleeps == []
+
+
+class TestCarouselDelaySeconds:
+    """Tests for non-blocking carousel delay sampling."""
+
+    def test_first_item_has_no_delay(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+
+        assert sim.carousel_delay_seconds(0) == 0.0
+
+    def test_delay_in_range_without_sleeping(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True)
+        delays = [sim.carousel_delay_seconds(i) for i in range(1, 20)]
+
+        assert all(sim.CAROUSEL_DELAY_MIN <= d <= sim.CAROUSEL_DELAY_MAX for d in delays)
+        assert clock.sleeps == []
+
+    def test_proxy_uses_aggressive_delay(self, clock: FakeClock) -> None:
+        sim = BehaviorSimulator(quiet=True, has_proxy=True)
+
+        assert sim.carousel_delay_seconds(1) == sim.AGGRESSIVE_CAROUSEL_DELAY
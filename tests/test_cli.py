@@ -0,0 +1,15 @@
+"""Tests for igdl command-line interface."""
+
+import pytest
+
+from igdl import __version__
+from igdl.cli import main
+
+
+class TestVersion:
+    """Tests for the --version fast path."""
+
+    @pytest.mark.parametrize("flag", ["-V", "--version"])
+    def test_version_flag(self, flag: str, capsys: pytest.CaptureFixture[str]) -> None:
+        assert main([flag]) == 0
+        assert capsys.readouterr().out == f"igdl {__version__}\n"
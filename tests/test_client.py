@@ -0,0 +1,521 @@
+"""Tests for igdl Instagram client."""
+
+import io
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+import urllib3
+
+from igdl import client as client_module
+from igdl.client import InstagramClient
+from igdl.exceptions import (
+    ApiError,
+    AuthenticationError,
+    DownloadError,
+    PrivateProfileError,
+    ProfileNotFoundError,
+    RateLimitError,
+)
+from igdl.models import Post, PostsPage, Profile
+
+
+def make_response(content: bytes, status_code: int = 200) -> requests.Response:
+    """Build a requests.Response with a fixed body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+def make_stream_response(content: bytes, status_code: int = 200) -> requests.Response:
+    """Build a streaming requests.Response backed by an in-memory raw body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+@pytest.fixture
+def client() -> InstagramClient:
+    return InstagramClient()
+
+
+class TestProfileHtml:
+    """Tests for HTML profile fallback parsing."""
+
+    def test_extracts_user_id_and_post_count(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        html = b'<html>"profilePage_12345" "edge_owner_to_timeline_media":{"count":42}</html>'
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            return make_response(html)
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        profile = client._get_profile_html("someone")
+
+        assert profile is not None
+        assert profile.user_id == "12345"
+        assert profile.post_count == 42
+        assert profile.username == "someone"
+
+    def test_no_user_id_returns_none(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            return make_response(b"<html></html>")
+
+        monkeypatch.setattr(client, "_request", fake_request)
+
+        assert client._get_profile_html("someone") is None
+
+    def test_private_profile_raises(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            return make_response(b'"user_id":"1" "is_private":true')
+
+        monkeypatch.setattr(client, "_request", fake_request)
+
+        with pytest.raises(PrivateProfileError):
+            client._get_profile_html("someone")
+
+
+class TestRequestErrors:
+    """Tests for _request status handling."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("igdl.client.time.sleep", lambda seconds: None)
+        monkeypatch.setattr("igdl.rate_limiter.time.sleep", lambda seconds: None)
+
+    def test_401_wait_is_rate_limit(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            return make_response(b'{"message":"Please WAIT a few minutes"}', status_code=401)
+
+        monkeypatch.setattr(client._session, "request", fake_request)
+
+        with pytest.raises(RateLimitError):
+            client._request("GET", "https://www.instagram.com/", max_retries=1)
+
+    def test_401_without_wait_is_api_error(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            return make_response(b'{"message":"login required"}', status_code=401)
+
+        monkeypatch.setattr(client._session, "request", fake_request)
+
+        with pytest.raises(ApiError):
+            client._request("GET", "https://www.instagram.com/", max_retries=1)
+
+    def test_refresh_waits_for_in_flight_request(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        events: list[str] = []
+        old_session = client._session
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            started.set()
+            release.wait(timeout=5)
+            events.append("request done")
+            return make_response(b"{}")
+
+        def fake_close() -> None:
+            events.append("session closed")
+
+        monkeypatch.setattr(old_session, "request", fake_request)
+        monkeypatch.setattr(old_session, "close", fake_close)
+        worker = threading.Thread(
+            target=client._request, args=("GET", "https://www.instagram.com/")
+        )
+        worker.start()
+        assert started.wait(timeout=5)
+
+        refresher = threading.Thread(target=client.refresh_session)
+        refresher.start()
+        refresher.join(timeout=0.1)
+        assert refresher.is_alive()
+
+        release.set()
+        worker.join(timeout=5)
+        refresher.join(timeout=5)
+
+        assert events == ["request done", "session closed"]
+        assert client._session is not old_session
+
+
+def make_post(shortcode: str) -> Post:
+    """Build a minimal image post."""
+    return Post(
+        shortcode=shortcode,
+        typename="GraphImage",
+        display_url=f"https://cdn.example/{shortcode}.jpg",
+        video_url=None,
+        is_video=False,
+        timestamp=datetime(2024, 1, 1),
+    )
+
+
+class TestIterPosts:
+    """Tests for paginated post iteration."""
+
+    PAGES = {
+        None: PostsPage([make_post("A"), make_post("B")], True, "c1"),
+        "c1": PostsPage([make_post("C"), make_post("D")], True, "c2"),
+        "c2": PostsPage([make_post("E")], False, None),
+    }
+
+    @pytest.fixture
+    def requested(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> list[str | None]:
+        cursors: list[str | None] = []
+
+        def fake_page(user_id: str, first: int = 12, after: str | None = None) -> PostsPage:
+            cursors.append(after)
+            return self.PAGES[after]
+
+        monkeypatch.setattr(client, "_get_page_impl", fake_page)
+        monkeypatch.setattr(client.behavior, "page_delay", lambda: None)
+        return cursors
+
+    def test_yields_all_pages_in_order(
+        self, client: InstagramClient, requested: list[str | None]
+    ) -> None:
+        shortcodes = [post.shortcode for post in client.iter_posts("1")]
+
+        assert shortcodes == ["A", "B", "C", "D", "E"]
+        assert requested == [None, "c1", "c2"]
+
+    def test_limit_skips_unneeded_prefetch(
+        self, client: InstagramClient, requested: list[str | None]
+    ) -> None:
+        shortcodes = [post.shortcode for post in client.iter_posts("1", limit=2)]
+
+        assert shortcodes == ["A", "B"]
+        assert requested == [None]
+
+
+class TestPostsEndpoint:
+    """Tests for posts endpoint selection."""
+
+    def test_anonymous_uses_graphql(self, client: InstagramClient) -> None:
+        assert client._get_page_impl == client._get_posts_page_graphql
+
+    def test_cookies_use_rest(self, tmp_path: Path) -> None:
+        cookies = tmp_path / "cookies.txt"
+        cookies.write_text("# Netscape HTTP Cookie File\n", encoding="utf-8")
+
+        client = InstagramClient(cookies_file=cookies)
+
+        assert client._get_page_impl == client._get_posts_page_rest
+
+    def test_highlights_require_cookies(self, client: InstagramClient) -> None:
+        with pytest.raises(AuthenticationError):
+            client.get_highlights("1")
+
+
+class TestGraphqlVariables:
+    """Tests for GraphQL posts query parameters."""
+
+    @pytest.mark.parametrize("after", [None, "QVFCa2xhYmVs=="])
+    def test_variables_match_json(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, after: str | None
+    ) -> None:
+        sent: list[dict[str, str]] = []
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+            sent.append(kwargs["params"])
+            return make_response(b'{"data": {"user": {}}}')
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        with pytest.raises(ApiError):
+            client._get_posts_page_graphql("12345", first=12, after=after)
+
+        expected: dict[str, Any] = {"id": "12345", "first": 12}
+        if after:
+            expected["after"] = after
+        assert json.loads(sent[0]["variables"]) == expected
+
+
+class TestPostsPageParsing:
+    """Tests for GraphQL posts page decoding."""
+
+    PAGE = {
+        "data": {
+            "user": {
+                "edge_owner_to_timeline_media": {
+                    "count": 2,
+                    "edges": [
+                        {
+                            "node": {
+                                "__typename": "GraphSidecar",
+                                "shortcode": "ABC",
+                                "display_url": "https://cdn.example/abc.jpg",
+                                "is_video": False,
+                                "taken_at_timestamp": 1700000000,
+                                "thumbnail_resources": [{"src": "unused", "config_width": 150}],
+                                "edge_media_to_caption": {"edges": [{"node": {"text": "hi"}}]},
+                                "edge_sidecar_to_children": {
+                                    "edges": [
+                                        {"node": {"is_video": True, "video_url": "v.mp4"}},
+                                        {"node": {"is_video": False, "display_url": "i.jpg"}},
+                                    ]
+                                },
+                                "edge_media_preview_like": {"count": 7},
+                            }
+                        }
+                    ],
+                    "page_info": {"has_next_page": True, "end_cursor": "QVFD=="},
+                }
+            }
+        }
+    }
+
+    def test_matches_generic_parse(self) -> None:
+        response = make_response(json.dumps(self.PAGE).encode())
+
+        decoded = client_module._parse_posts_page_json(response)
+
+        assert PostsPage.from_api_response(decoded["data"]["user"]) == (
+            PostsPage.from_api_response(self.PAGE["data"]["user"])
+        )
+
+    def test_unexpected_shape_falls_back(self) -> None:
+        page = {"data": {"user": {"edge_owner_to_timeline_media": {"edges": "oops"}}}}
+        response = make_response(json.dumps(page).encode())
+
+        assert client_module._parse_posts_page_json(response) == page
+
+    def test_invalid_json_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            client_module._parse_posts_page_json(make_response(b"<html>"))
+
+
+class TestDownloadMedia:
+    """Tests for CDN media downloads."""
+
+    def test_writes_body_to_file(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        body = b"x" * 100_000
+
+        def fake_get(url: str, **kwargs: Any) -> requests.Response:
+            return make_stream_response(body)
+
+        monkeypatch.setattr(client._cdn_session, "get", fake_get)
+        filepath = tmp_path / "media.jpg"
+        client.download_media("https://cdn.example/media.jpg", filepath)
+
+        assert filepath.read_bytes() == body
+
+    def test_http_error_raises_download_error(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        def fake_get(url: str, **kwargs: Any) -> requests.Response:
+            return make_stream_response(b"", status_code=403)
+
+        monkeypatch.setattr(client._cdn_session, "get", fake_get)
+        monkeypatch.setattr("igdl.client.time.sleep", lambda seconds: None)
+        filepath = tmp_path / "media.jpg"
+
+        with pytest.raises(DownloadError):
+            client.download_media("https://cdn.example/media.jpg", filepath)
+        assert not filepath.exists()
+
+    def test_failed_stream_keeps_existing_file(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        class BrokenStream(io.BytesIO):
+            def read(self, size: int | None = -1) -> bytes:
+                raise urllib3.exceptions.ProtocolError("connection reset")
+
+        def fake_get(url: str, **kwargs: Any) -> requests.Response:
+            response = make_stream_response(b"")
+            response.raw = BrokenStream()
+            return response
+
+        monkeypatch.setattr(client._cdn_session, "get", fake_get)
+        monkeypatch.setattr("igdl.client.time.sleep", lambda seconds: None)
+        filepath = tmp_path / "media.jpg"
+        filepath.write_bytes(b"old")
+
+        with pytest.raises(DownloadError):
+            client.download_media("https://cdn.example/media.jpg", filepath)
+        assert filepath.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [filepath]
+
+    def test_not_modified_keeps_existing_file(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        sent_headers: list[Any] = []
+
+        def fake_get(url: str, **kwargs: Any) -> requests.Response:
+            sent_headers.append(kwargs.get("headers"))
+            return make_stream_response(b"", status_code=304)
+
+        monkeypatch.setattr(client._cdn_session, "get", fake_get)
+        filepath = tmp_path / "media.jpg"
+        filepath.write_bytes(b"cached")
+        result = client.download_media("https://cdn.example/media.jpg", filepath, etag='"abc"')
+
+        assert result == (False, '"abc"')
+        assert sent_headers == [{"If-None-Match": '"abc"'}]
+        assert filepath.read_bytes() == b"cached"
+
+    def test_missing_file_downloads_without_condition(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        sent_headers: list[Any] = []
+
+        def fake_get(url: str, **kwargs: Any) -> requests.Response:
+            sent_headers.append(kwargs.get("headers"))
+            response = make_stream_response(b"fresh")
+            response.headers["ETag"] = '"abc"'
+            return response
+
+        monkeypatch.setattr(client._cdn_session, "get", fake_get)
+        filepath = tmp_path / "media.jpg"
+        result = client.download_media("https://cdn.example/media.jpg", filepath, etag='"abc"')
+
+        assert result == (True, '"abc"')
+        assert sent_headers == [None]
+        assert filepath.read_bytes() == b"fresh"
+
+
+class TestDownloadMany:
+    """Tests for concurrent CDN downloads."""
+
+    def test_results_in_input_order_with_failures(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        def fake_get(url: str, **kwargs: Any) -> requests.Response:
+            if url.endswith("bad.jpg"):
+                return make_stream_response(b"", status_code=404)
+            return make_stream_response(url.encode())
+
+        monkeypatch.setattr(client._cdn_session, "get", fake_get)
+        monkeypatch.setattr("igdl.client.time.sleep", lambda seconds: None)
+        names = ("a.jpg", "bad.jpg", "b.jpg")
+        items = [(f"https://cdn.example/{name}", tmp_path / name, None) for name in names]
+
+        results = client.download_many(iter(items), workers=4)
+
+        assert results[0] == (True, None)
+        assert isinstance(results[1], DownloadError)
+        assert results[2] == (True, None)
+        assert (tmp_path / "a.jpg").read_bytes() == b"https://cdn.example/a.jpg"
+        assert not (tmp_path / "bad.jpg").exists()
+
+
+class TestProfileCache:
+    """Tests for profile caching."""
+
+    def test_profile_fetched_once(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        def fake_api(username: str) -> Profile:
+            calls.append(username)
+            return Profile("1", username, "", False, 10)
+
+        monkeypatch.setattr(client, "_get_profile_api", fake_api)
+        first = client.get_profile("someone")
+        second = client.get_profile("someone")
+
+        assert first is second
+        assert calls == ["someone"]
+
+    def test_refresh_session_invalidates(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        def fake_api(username: str) -> Profile:
+            calls.append(username)
+            return Profile("1", username, "", False, 10)
+
+        monkeypatch.setattr(client, "_get_profile_api", fake_api)
+        client.get_profile("someone")
+        client.refresh_session()
+        client.get_profile("someone")
+
+        assert calls == ["someone", "someone"]
+
+    def test_prefetch_is_picked_up(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[str] = []
+
+        def fake_api(username: str) -> Profile:
+            calls.append(username)
+            return Profile("1", username, "", False, 10)
+
+        monkeypatch.setattr(client, "_get_profile_api", fake_api)
+        client.prefetch_profile("someone")
+        client.prefetch_profile("someone")
+        profile = client.get_profile("someone")
+
+        assert profile.username == "someone"
+        assert calls == ["someone"]
+
+    def test_prefetch_error_surfaces_on_get(
+        self, client: InstagramClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(client, "_get_profile_api", lambda username: None)
+        monkeypatch.setattr(client, "_get_profile_html", lambda username: None)
+        client.prefetch_profile("missing")
+
+        with pytest.raises(ProfileNotFoundError):
+            client.get_profile("missing")
+
+
+class TestCookieCache:
+    """Tests for cookie file caching across session refreshes."""
+
+    COOKIE_LINE = ".instagram.com\tTRUE\t/\tTRUE\t0\t{name}\t{value}\n"
+
+    def write_cookies(self, path: Path, value: str) -> None:
+        path.write_text(
+            "# Netscape HTTP Cookie File\n"
+            + self.COOKIE_LINE.format(name="sessionid", value=value),
+            encoding="utf-8",
+        )
+
+    def test_refresh_reuses_jar_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "cookies.txt"
+        self.write_cookies(path, "first")
+        calls: list[Path] = []
+        original = client_module.load_cookies_file
+
+        def counting_load(p: Path) -> Any:
+            calls.append(p)
+            return original(p)
+
+        monkeypatch.setattr(client_module, "load_cookies_file", counting_load)
+        client = InstagramClient(cookies_file=path)
+        client.refresh_session()
+
+        assert len(calls) == 1
+        assert client._session.cookies.get("sessionid") == "first"
+
+        self.write_cookies(path, "second")
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+        client.refresh_session()
+
+        assert len(calls) == 2
+        assert client._session.cookies.get("sessionid") == "second"
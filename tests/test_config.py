@@ -0,0 +1,81 @@
+"""Tests for igdl configuration loading."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from igdl import config as config_module
+from igdl.config import Config
+
+
+@pytest.fixture
+def config_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "config.toml"
+    monkeypatch.setattr(config_module, "CONFIG_FILE", path)
+    config_module._read_config_file.cache_clear()
+    return path
+
+
+class TestConfigFromDict:
+    """Tests for Config.from_dict."""
+
+    def test_converts_known_keys(self) -> None:
+        config = Config.from_dict(
+            {
+                "proxy": "http://host:8080",
+                "cookies": "~/cookies.txt",
+                "output": "/tmp/out",
+                "auto_archive": 1,
+                "unknown": "ignored",
+            }
+        )
+
+        assert config.proxy == "http://host:8080"
+        assert config.cookies == Path.home() / "cookies.txt"
+        assert config.output == Path("/tmp/out")
+        assert config.auto_archive is True
+        assert config.proxy_file is None
+        assert not hasattr(config, "unknown")
+
+
+class TestConfigLoad:
+    """Tests for Config.load."""
+
+    def test_missing_file_returns_defaults(self, config_file: Path) -> None:
+        assert Config.load() == Config()
+
+    def test_invalid_file_returns_defaults(self, config_file: Path) -> None:
+        config_file.write_text("not = [valid", encoding="utf-8")
+
+        assert Config.load() == Config()
+
+    def test_reuses_parse_until_mtime_changes(self, config_file: Path) -> None:
+        config_file.write_text('proxy = "http://a:1"\n', encoding="utf-8")
+        first = Config.load()
+        first.proxy = "mutated"
+
+        assert Config.load().proxy == "http://a:1"
+        assert config_module._read_config_file.cache_info().hits == 1
+
+        config_file.write_text('proxy = "http://b:2"\n', encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert Config.load().proxy == "http://b:2"
+
+
+class TestExpand:
+    """Tests for config path expansion."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("~", Path.home()),
+            ("~/a/b.txt", Path.home() / "a" / "b.txt"),
+            ("/abs/path", Path("/abs/path")),
+            ("rel/~path", Path("rel/~path")),
+        ],
+    )
+    def test_expand(self, value: str, expected: Path) -> None:
+        assert config_module._expand(value) == expected
@@ -0,0 +1,440 @@
+"""Tests for igdl download orchestration."""
+
+import json
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from rich.progress import Progress
+
+from igdl import downloader as downloader_module
+from igdl.archive import DownloadArchive
+from igdl.aria2 import Aria2Downloader
+from igdl.client import InstagramClient
+from igdl.downloader import Downloader, _BatchedProgress
+from igdl.exceptions import ApiError, DownloadError, PrivateProfileError
+from igdl.models import Highlight, HighlightItem, MediaItem, Post, Profile
+
+
+def make_post(shortcode: str, media_count: int) -> Post:
+    """Build a post with media_count carousel items (single image if 1)."""
+    media_items = [
+        MediaItem(url=f"https://cdn.example/{shortcode}_{i}.jpg", is_video=False, index=i)
+        for i in range(1, media_count + 1)
+    ]
+    return Post(
+        shortcode=shortcode,
+        typename="GraphSidecar" if media_count > 1 else "GraphImage",
+        display_url=f"https://cdn.example/{shortcode}.jpg",
+        video_url=None,
+        is_video=False,
+        timestamp=datetime(2024, 1, 1),
+        media_items=media_items if media_count > 1 else [],
+    )
+
+
+@pytest.fixture
+def downloader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Downloader:
+    client = InstagramClient()
+    monkeypatch.setattr(client.behavior, "carousel_delay_seconds", lambda index: 0.0)
+    instance = Downloader(client, output_dir=tmp_path, quiet=True)
+    instance._current_username = "user"
+    instance._username_prefix = "user_"
+    return instance
+
+
+class TestGetFilename:
+    """Tests for Downloader._get_filename."""
+
+    def test_single_media(self) -> None:
+        media = MediaItem(url="https://cdn.example/a.jpg", is_video=False)
+
+        assert Downloader._get_filename("user_ABC", media) == "user_ABC.jpg"
+
+    def test_carousel_item(self) -> None:
+        media = MediaItem(url="https://cdn.example/a.mp4", is_video=True, index=2)
+
+        assert Downloader._get_filename("user_ABC", media) == "user_ABC_2.mp4"
+
+
+class TestDownloadPost:
+    """Tests for Downloader.download_post."""
+
+    def test_carousel_items_download_concurrently(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        # Every item waits for the others; serial downloads would break the barrier
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            barrier.wait()
+            if url.endswith("_2.jpg"):
+                raise DownloadError(url, "boom")
+            filepath.write_bytes(b"data")
+            return True, None
+
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+        paths = downloader.download_post(make_post("ABC", 3), tmp_path)
+
+        assert paths == [tmp_path / "user_ABC_1.jpg", tmp_path / "user_ABC_3.jpg"]
+
+    def test_single_media_post(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            filepath.write_bytes(b"data")
+            return True, None
+
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+
+        assert downloader.download_post(make_post("XYZ", 1), tmp_path) == [
+            tmp_path / "user_XYZ.jpg"
+        ]
+
+    def test_existing_files_skipped_with_one_scan(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        (tmp_path / "user_ABC_1.jpg").write_bytes(b"old")
+        downloaded: list[str] = []
+
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            downloaded.append(filepath.name)
+            filepath.write_bytes(b"data")
+            return True, None
+
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+        downloader.download_post(make_post("ABC", 2), tmp_path)
+        downloader.download_post(make_post("ABC", 2), tmp_path)
+
+        assert downloaded == ["user_ABC_2.jpg"]
+        assert downloader._existing_names(tmp_path) == {"user_ABC_1.jpg", "user_ABC_2.jpg"}
+
+    def test_complete_post_skips_swipe_delays(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        for i in (1, 2, 3):
+            (tmp_path / f"user_ABC_{i}.jpg").write_bytes(b"old")
+        delays: list[int] = []
+
+        def fake_delay(index: int) -> float:
+            delays.append(index)
+            return 0.0
+
+        monkeypatch.setattr(downloader.client.behavior, "carousel_delay_seconds", fake_delay)
+
+        assert downloader.download_post(make_post("ABC", 3), tmp_path) == []
+        assert delays == []
+
+
+class TestArchiveBatching:
+    """Tests for batched archive updates in the requests fallback."""
+
+    def test_pending_archived_when_iteration_fails(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        downloader.archive = DownloadArchive(tmp_path / "archive.txt")
+
+        def fake_iter_posts(user_id: str, limit: int | None = None) -> Iterator[Post]:
+            yield make_post("ABC", 1)
+            raise ApiError(500, "boom")
+
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            filepath.write_bytes(b"data")
+            return True, None
+
+        monkeypatch.setattr(downloader.client, "iter_posts", fake_iter_posts)
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+        monkeypatch.setattr(downloader.client.behavior, "record_post_processed", lambda: None)
+
+        with pytest.raises(ApiError):
+            downloader._download_profile_requests("user", "1", tmp_path, None, 2)
+
+        assert (tmp_path / "archive.txt").read_text(encoding="utf-8") == "ABC\n"
+
+    def test_archive_flushed_every_interval(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        archive_file = tmp_path / "archive.txt"
+        downloader.archive = DownloadArchive(archive_file)
+        on_disk: list[str] = []
+
+        def fake_iter_posts(user_id: str, limit: int | None = None) -> Iterator[Post]:
+            for shortcode in ("A", "B", "C"):
+                on_disk.append(
+                    archive_file.read_text(encoding="utf-8") if archive_file.exists() else ""
+                )
+                yield make_post(shortcode, 1)
+
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            filepath.write_bytes(b"data")
+            return True, None
+
+        monkeypatch.setattr(downloader_module, "ARCHIVE_FLUSH_INTERVAL", 2)
+        monkeypatch.setattr(downloader.client, "iter_posts", fake_iter_posts)
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+        monkeypatch.setattr(downloader.client.behavior, "record_post_processed", lambda: None)
+
+        downloader._download_profile_requests("user", "1", tmp_path, None, 3)
+
+        # A and B hit the disk before C is even listed
+        assert on_disk == ["", "", "A\nB\n"]
+        assert archive_file.read_text(encoding="utf-8") == "A\nB\nC\n"
+
+    def test_etags_stored_alongside_archive(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        downloader.archive = DownloadArchive(tmp_path / "archive.txt")
+        media_dir = tmp_path / "user"
+        media_dir.mkdir()
+
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            filepath.write_bytes(b"data")
+            return True, '"v1"'
+
+        monkeypatch.setattr(
+            downloader.client, "iter_posts", lambda user_id, limit=None: iter([make_post("A", 2)])
+        )
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+        monkeypatch.setattr(downloader.client.behavior, "record_post_processed", lambda: None)
+
+        downloader._download_profile_requests("user", "1", media_dir, None, 1)
+
+        etags_file = tmp_path / "archive.txt.etags.json"
+        assert json.loads(etags_file.read_bytes()) == {
+            "user_A_1.jpg": '"v1"',
+            "user_A_2.jpg": '"v1"',
+        }
+        assert sorted(p.name for p in media_dir.iterdir()) == ["user_A_1.jpg", "user_A_2.jpg"]
+
+    def test_stored_etag_with_missing_file_counts_as_download(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        downloader.archive = DownloadArchive(tmp_path / "archive.txt")
+        etags = json.dumps({"user_A.jpg": '"v1"'})
+        (tmp_path / "archive.txt.etags.json").write_text(etags, encoding="utf-8")
+        media_dir = tmp_path / "user"
+        media_dir.mkdir()
+
+        def fake_download(
+            url: str, filepath: Path, etag: str | None = None
+        ) -> tuple[bool, str | None]:
+            # File is gone, so this is a full 200 that reports the same ETag
+            filepath.write_bytes(b"data")
+            return True, '"v1"'
+
+        monkeypatch.setattr(
+            downloader.client, "iter_posts", lambda user_id, limit=None: iter([make_post("A", 1)])
+        )
+        monkeypatch.setattr(downloader.client, "download_media", fake_download)
+        monkeypatch.setattr(downloader.client.behavior, "record_post_processed", lambda: None)
+
+        result = downloader._download_profile_requests("user", "1", media_dir, None, 1)
+
+        assert result == (1, 0)
+        assert "user_A.jpg" in downloader._existing_names(media_dir)
+        assert downloader.archive.contains("A")
+
+
+class TestAria2Pipeline:
+    """Tests for overlapping aria2c batches with post listing."""
+
+    def test_next_batch_listed_while_previous_downloads(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        archive_file = tmp_path / "archive.txt"
+        downloader.archive = DownloadArchive(archive_file)
+        next_post_listed = threading.Event()
+        overlapped: list[bool] = []
+        write_threads: set[str] = set()
+        write = downloader.archive._write
+
+        def fake_run(self: Aria2Downloader, input_file: Path) -> tuple[int, int]:
+            # The first batch only finishes once the main thread lists post B
+            if self._items[0].shortcode == "A":
+                overlapped.append(next_post_listed.wait(timeout=5))
+            for item in self._items:
+                (self.output_dir / item.filename).write_bytes(b"data")
+            return len(self._items), 0
+
+        def fake_iter_posts(user_id: str, limit: int | None = None) -> Iterator[Post]:
+            yield make_post("A", 1)
+            next_post_listed.set()
+            yield make_post("B", 1)
+            yield make_post("C", 1)
+
+        def tracking_write(keys: list[bytes], sync: bool = False) -> None:
+            write_threads.add(threading.current_thread().name)
+            write(keys, sync)
+
+        monkeypatch.setattr(downloader_module, "ARIA2_BATCH_SIZE", 1)
+        monkeypatch.setattr(Aria2Downloader, "_run_aria2c", fake_run)
+        monkeypatch.setattr(downloader.client, "iter_posts", fake_iter_posts)
+        monkeypatch.setattr(downloader.client.behavior, "record_post_processed", lambda: None)
+        monkeypatch.setattr(downloader.archive, "_write", tracking_write)
+
+        result = downloader._download_profile_aria2("user", "1", tmp_path, None, 3)
+
+        assert result == (3, 0)
+        assert overlapped == [True]
+        # Archive appends and fsyncs run on the archive's writer thread only
+        assert len(write_threads) == 1
+        assert write_threads.pop().startswith("igdl-archive")
+        assert set(downloader.archive.snapshot()) == {b"A", b"B", b"C"}
+        assert sorted(archive_file.read_text(encoding="utf-8").split()) == ["A", "B", "C"]
+
+    def test_running_batch_archived_when_listing_fails(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        archive_file = tmp_path / "archive.txt"
+        downloader.archive = DownloadArchive(archive_file)
+        listing_failed = threading.Event()
+
+        def fake_run(self: Aria2Downloader, input_file: Path) -> tuple[int, int]:
+            # Still downloading when the listing error reaches the main thread
+            listing_failed.wait(timeout=5)
+            for item in self._items:
+                (self.output_dir / item.filename).write_bytes(b"data")
+            return len(self._items), 0
+
+        def fake_iter_posts(user_id: str, limit: int | None = None) -> Iterator[Post]:
+            yield make_post("A", 1)
+            listing_failed.set()
+            raise ApiError(429, "rate limited")
+
+        monkeypatch.setattr(downloader_module, "ARIA2_BATCH_SIZE", 1)
+        monkeypatch.setattr(Aria2Downloader, "_run_aria2c", fake_run)
+        monkeypatch.setattr(downloader.client, "iter_posts", fake_iter_posts)
+        monkeypatch.setattr(downloader.client.behavior, "record_post_processed", lambda: None)
+
+        with pytest.raises(ApiError):
+            downloader._download_profile_aria2("user", "1", tmp_path, None, 2)
+
+        assert archive_file.read_text(encoding="utf-8") == "A\n"
+
+
+class TestBatchedProgress:
+    """Tests for coalesced progress updates."""
+
+    def test_advances_are_coalesced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 0.0
+        monkeypatch.setattr(downloader_module.time, "monotonic", lambda: now)
+        progress = Progress(disable=True)
+        task = progress.add_task("test", total=10)
+        bar = _BatchedProgress(progress, task, min_interval=1.0)
+
+        for _ in range(3):
+            bar.advance()
+        assert progress.tasks[0].completed == 0
+
+        now = 1.0
+        bar.advance()
+        assert progress.tasks[0].completed == 4
+
+        bar.advance()
+        bar.flush()
+        assert progress.tasks[0].completed == 5
+
+
+class TestHighlightsAria2:
+    """Tests for the aria2c highlights pipeline."""
+
+    def test_next_highlight_fetched_during_download(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        second_fetched = threading.Event()
+
+        def fake_items(highlight_id: str) -> list[HighlightItem]:
+            if highlight_id == "2":
+                second_fetched.set()
+            return [
+                HighlightItem(
+                    media_id=highlight_id,
+                    is_video=False,
+                    url=f"https://cdn.example/{highlight_id}.jpg",
+                    timestamp=datetime(2024, 1, 1),
+                )
+            ]
+
+        def fake_run(self: Aria2Downloader, input_file: Path) -> tuple[int, int]:
+            # The first batch can only finish once the next highlight was fetched
+            assert second_fetched.wait(timeout=5)
+            for item in self._items:
+                assert item.directory is not None
+                (item.directory / item.filename).write_bytes(b"data")
+            return len(self._items), 0
+
+        monkeypatch.setattr(downloader_module, "ARIA2_BATCH_SIZE", 1)
+        monkeypatch.setattr(Aria2Downloader, "_run_aria2c", fake_run)
+        monkeypatch.setattr(downloader.client, "get_highlight_items", fake_items)
+        monkeypatch.setattr(downloader.client.behavior, "highlight_switch_delay", lambda: None)
+        highlights = [
+            Highlight(highlight_id="1", title="One", media_count=1),
+            Highlight(highlight_id="2", title="Two", media_count=1),
+        ]
+
+        result = downloader._download_highlights_aria2("user", highlights)
+
+        assert result == (2, 0)
+        assert "1" in downloader.archive
+        assert "2" in downloader.archive
+        assert (tmp_path / "user" / "highlights" / "two").is_dir()
+
+
+class TestDownloadProfiles:
+    """Tests for multi-profile downloads with profile prefetching."""
+
+    def test_prefetched_lookup_error_is_recorded(
+        self, downloader: Downloader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        lookups: list[str] = []
+
+        def fake_api(username: str) -> Profile:
+            lookups.append(username)
+            if username == "private":
+                raise PrivateProfileError(username)
+            return Profile("1", username, "", False, 1)
+
+        def fake_download(
+            username: str, user_id: str, target_dir: Path, limit: int | None, post_count: int
+        ) -> tuple[int, int]:
+            return 1, 0
+
+        downloader._use_aria2 = False
+        monkeypatch.setattr(downloader.client, "_get_profile_api", fake_api)
+        monkeypatch.setattr(downloader, "_download_profile_requests", fake_download)
+
+        results = downloader.download_profiles(["public", "private"])
+
+        assert results == {"public": (1, 0), "private": (0, 0)}
+        assert sorted(lookups) == ["private", "public"]
+        assert downloader.client._profile_prefetch == {}
+
+
+class TestProgressDisplay:
+    """Tests for progress bar visibility."""
+
+    def test_hidden_when_not_a_terminal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(downloader_module, "console", Console(force_terminal=False))
+
+        assert Downloader(InstagramClient(), quiet=False)._hide_progress
+
+    def test_shown_on_terminal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(downloader_module, "console", Console(force_terminal=True))
+
+        assert not Downloader(InstagramClient(), quiet=False)._hide_progress
+        assert Downloader(InstagramClient(), quiet=True)._hide_progress
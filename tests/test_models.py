@@ -1,8 +1,12 @@
 """Tests for igdl data models."""
 
+import dataclasses
+import sys
 from datetime import datetime, timezone
 
-from igdl.models import Highlight, HighlightItem, slugify
+import pytest
+
+from igdl.models import Highlight, HighlightItem, MediaItem, Post, slugify
 
 # ------------------------------------------------------------------
 # slugify
@@ -57,6 +61,16 @@ class TestSlugify:
     def test_single_word(self) -> None:
         assert slugify("highlights") == "highlights"
 
+    def test_single_word_lowercased(self) -> None:
+        assert slugify("Travel2024") == "travel2024"
+
+    def test_repeated_titles_cached(self) -> None:
+        slugify.cache_clear()
+        slugify("Sea 2025")
+        slugify("Sea 2025")
+
+        assert slugify.cache_info().hits == 1
+
     def test_cyrillic_preserved(self) -> None:
         assert slugify("Море") == "море"
 
@@ -72,6 +86,96 @@ class TestSlugify:
         assert slugify("a\t\nb") == "a-b"
 
 
+# ------------------------------------------------------------------
+# MediaItem
+# ------------------------------------------------------------------
+
+
+class TestMediaItem:
+    """Tests for the frozen MediaItem model."""
+
+    def test_hashable_and_deduplicated(self) -> None:
+        media = MediaItem(url="https://cdn.example/a.jpg", is_video=False, index=1)
+        duplicate = MediaItem(url="https://cdn.example/a.jpg", is_video=False, index=1)
+
+        assert hash(media) == hash(duplicate)
+        assert {media, duplicate} == {media}
+
+    def test_immutable(self) -> None:
+        media = MediaItem(url="https://cdn.example/a.jpg", is_video=False)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            media.index = 2  # type: ignore[misc]
+
+
+# ------------------------------------------------------------------
+# Post.from_node / Post.from_rest_item
+# ------------------------------------------------------------------
+
+
+class TestPostFactories:
+    """Tests for Post factory methods."""
+
+    def test_from_rest_item_matches_init(self) -> None:
+        data = {
+            "code": "ABC",
+            "taken_at": 1700000000,
+            "media_type": 8,
+            "caption": {"text": "hi"},
+            "like_count": 5,
+            "image_versions2": {"candidates": [{"url": "https://cdn.example/a.jpg"}]},
+            "carousel_media": [
+                {"media_type": 2, "video_versions": [{"url": "https://cdn.example/1.mp4"}]},
+            ],
+        }
+
+        post = Post.from_rest_item(data)
+
+        assert post == Post(
+            shortcode="ABC",
+            typename="GraphSidecar",
+            display_url="https://cdn.example/a.jpg",
+            video_url=None,
+            is_video=False,
+            timestamp=datetime.fromtimestamp(1700000000, tz=timezone.utc),
+            caption="hi",
+            like_count=5,
+            media_items=[MediaItem(url="https://cdn.example/1.mp4", is_video=True, index=1)],
+        )
+
+    def test_from_node_defaults(self) -> None:
+        post = Post.from_node({"shortcode": "XYZ"})
+
+        assert post == Post(
+            shortcode="XYZ",
+            typename="GraphImage",
+            display_url="",
+            video_url=None,
+            is_video=False,
+            timestamp=datetime.fromtimestamp(0, tz=timezone.utc),
+        )
+
+    def test_timestamps_shared_between_posts(self) -> None:
+        first = Post.from_rest_item({"code": "A", "taken_at": 1700000000})
+        second = Post.from_rest_item({"code": "B", "taken_at": 1700000000})
+
+        assert first.timestamp is second.timestamp
+
+    def test_from_node_interns_typename(self) -> None:
+        typename = "".join(["Graph", "Sidecar"])
+        post = Post.from_node({"shortcode": "XYZ", "__typename": typename})
+
+        assert post.typename is sys.intern("GraphSidecar")
+        assert post.is_carousel
+
+    def test_from_rest_item_media_types(self) -> None:
+        video = Post.from_rest_item({"code": "V", "media_type": 2})
+        unknown = Post.from_rest_item({"code": "U", "media_type": 99})
+
+        assert (video.typename, video.is_video) == ("GraphVideo", True)
+        assert (unknown.typename, unknown.is_video) == ("GraphImage", False)
+
+
 # ------------------------------------------------------------------
 # HighlightItem.from_rest_item
 # ------------------------------------------------------------------
@@ -175,6 +279,11 @@ class TestHighlight:
 
         assert hl.highlight_id == "12345"
 
+    def test_from_tray_item_numeric_id(self) -> None:
+        hl = Highlight.from_tray_item({"id": 12345, "title": "Test", "media_count": 1})
+
+        assert hl.highlight_id == "12345"
+
     def test_slug_property(self) -> None:
         hl = Highlight(highlight_id="1", title="My Summer Trip", media_count=3)
         assert hl.slug == "my-summer-trip"
@@ -203,7 +312,7 @@ class TestDeduplicateSlug:
     def test_no_collision(self) -> None:
         from igdl.downloader import Downloader
 
-        used: set[str] = set()
+        used: dict[str, int] = {}
         result = Downloader._deduplicate_slug("sea-2025", used)
 
         assert result == "sea-2025"
@@ -212,7 +321,7 @@ class TestDeduplicateSlug:
     def test_single_collision(self) -> None:
         from igdl.downloader import Downloader
 
-        used: set[str] = {"sea-2025"}
+        used: dict[str, int] = {"sea-2025": 2}
         result = Downloader._deduplicate_slug("sea-2025", used)
 
         assert result == "sea-2025_2"
@@ -221,7 +330,7 @@ class TestDeduplicateSlug:
     def test_multiple_collisions(self) -> None:
         from igdl.downloader import Downloader
 
-        used: set[str] = {"travel", "travel_2", "travel_3"}
+        used: dict[str, int] = dict.fromkeys(["travel", "travel_2", "travel_3"], 2)
         result = Downloader._deduplicate_slug("travel", used)
 
         assert result == "travel_4"
@@ -229,7 +338,7 @@ class TestDeduplicateSlug:
     def test_sequential_dedup(self) -> None:
         from igdl.downloader import Downloader
 
-        used: set[str] = set()
+        used: dict[str, int] = {}
         r1 = Downloader._deduplicate_slug("test", used)
         r2 = Downloader._deduplicate_slug("test", used)
         r3 = Downloader._deduplicate_slug("test", used)
@@ -237,3 +346,11 @@ class TestDeduplicateSlug:
         assert r1 == "test"
         assert r2 == "test_2"
         assert r3 == "test_3"
+
+    def test_suffixed_title_collision(self) -> None:
+        from igdl.downloader import Downloader
+
+        used: dict[str, int] = {}
+        slugs = [Downloader._deduplicate_slug(s, used) for s in ("a", "a_2", "a", "a")]
+
+        assert slugs == ["a", "a_2", "a_3", "a_4"]
@@ -0,0 +1,76 @@
+"""Tests for igdl proxy rotation."""
+
+from pathlib import Path
+
+from igdl.proxy import ProxyRotator
+
+
+class TestProxyFile:
+    """Tests for loading proxy lists."""
+
+    def test_skips_blank_lines_and_comments(self, tmp_path: Path) -> None:
+        path = tmp_path / "proxies.txt"
+        path.write_text("# comment\nhttp://a:1\n\n  http://b:2  \n#http://c:3\n", encoding="utf-8")
+
+        rotator = ProxyRotator(proxy_file=path, quiet=True)
+
+        assert sorted(rotator._proxies) == ["http://a:1", "http://b:2"]
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        rotator = ProxyRotator(proxy_file=tmp_path / "missing.txt", quiet=True)
+
+        assert not rotator.enabled
+        assert rotator.get_current() is None
+
+
+class TestRotation:
+    """Tests for proxy rotation."""
+
+    def test_rotate_on_error_switches_proxy(self, tmp_path: Path) -> None:
+        path = tmp_path / "proxies.txt"
+        path.write_text("http://a:1\nhttp://b:2\n", encoding="utf-8")
+        rotator = ProxyRotator(proxy_file=path, quiet=True)
+        first = rotator.get_current()
+
+        rotator.rotate_on_error()
+
+        assert rotator.get_current() != first
+        assert rotator.get_proxies_dict() == {
+            "http": rotator.get_current(),
+            "https": rotator.get_current(),
+        }
+
+    def test_rotates_every_n_requests(self, tmp_path: Path) -> None:
+        path = tmp_path / "proxies.txt"
+        path.write_text("http://a:1\nhttp://b:2\n", encoding="utf-8")
+        rotator = ProxyRotator(proxy_file=path, quiet=True)
+        first = rotator.get_current()
+
+        for _ in range(rotator.ROTATE_EVERY_REQUESTS - 1):
+            rotator.record_request()
+        assert rotator.get_current() == first
+
+        rotator.record_request()
+        assert rotator.get_current() != first
+
+    def test_error_rotation_resets_count(self, tmp_path: Path) -> None:
+        path = tmp_path / "proxies.txt"
+        path.write_text("http://a:1\nhttp://b:2\n", encoding="utf-8")
+        rotator = ProxyRotator(proxy_file=path, quiet=True)
+        for _ in range(rotator.ROTATE_EVERY_REQUESTS - 1):
+            rotator.record_request()
+
+        rotator.rotate_on_error()
+        after_error = rotator.get_current()
+        rotator.record_request()
+
+        assert rotator.get_current() == after_error
+
+    def test_proxies_dict_reused(self) -> None:
+        rotator = ProxyRotator(proxy="http://a:1", quiet=True)
+
+        proxies = rotator.get_proxies_dict()
+
+        assert proxies == {"http": "http://a:1", "https": "http://a:1"}
+        assert rotator.get_proxies_dict() is proxies
+        assert ProxyRotator(quiet=True).get_proxies_dict() is None
@@ -0,0 +1,107 @@
+"""Tests for igdl rate limiter."""
+
+import pytest
+
+from igdl import rate_limiter
+from igdl.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def frozen_time(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [0.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestRetryBucket:
+    """Tests for the adaptive retry budget."""
+
+    def test_throttle_exhausts_budget(self, frozen_time: list[float]) -> None:
+        limiter = RateLimiter(quiet=True)
+        allowed = [limiter.on_throttle() for _ in range(10)]
+
+        assert all(allowed[:9])
+        assert not allowed[9]
+
+    def test_budget_refills_over_time(self, frozen_time: list[float]) -> None:
+        limiter = RateLimiter(quiet=True)
+        for _ in range(10):
+            limiter.on_throttle()
+
+        frozen_time[0] += 10.0
+
+        assert limiter.on_throttle()
+
+    def test_success_refunds_tokens(self, frozen_time: list[float]) -> None:
+        limiter = RateLimiter(quiet=True)
+        for _ in range(9):
+            limiter.on_throttle()
+        for _ in range(10):
+            limiter.on_success()
+
+        assert limiter.on_throttle()
+
+
+class TestRandomDelay:
+    """Tests for batched random delays."""
+
+    def test_delays_within_bounds(self) -> None:
+        limiter = RateLimiter(quiet=True)
+        delays = [limiter._random_delay() for _ in range(limiter.DELAY_BATCH_SIZE * 2)]
+
+        assert all(limiter.MIN_DELAY <= d <= limiter.MAX_DELAY for d in delays)
+
+    def test_batches_are_redrawn(self) -> None:
+        limiter = RateLimiter(quiet=True, has_proxy=True)
+        n = limiter.DELAY_BATCH_SIZE
+        delays = [limiter._random_delay() for _ in range(n * 2)]
+
+        assert all(
+            limiter.AGGRESSIVE_MIN_DELAY <= d <= limiter.AGGRESSIVE_MAX_DELAY for d in delays
+        )
+        assert delays[:n] != delays[n:]
+
+
+class TestHostWindows:
+    """Tests for per-host sliding windows."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        recorded: list[float] = []
+        monkeypatch.setattr(rate_limiter.time, "sleep", recorded.append)
+        return recorded
+
+    def test_full_host_does_not_block_other_host(
+        self, frozen_time: list[float], sleeps: list[float]
+    ) -> None:
+        limiter = RateLimiter(quiet=True)
+        for _ in range(limiter.MAX_REQUESTS):
+            limiter.record_request("www.instagram.com")
+
+        limiter.wait_if_needed("cdn.example")
+
+        assert len(sleeps) == 1  # Only the random inter-request delay
+
+        limiter.wait_if_needed("www.instagram.com")
+
+        assert sleeps[1] == pytest.approx(limiter.WINDOW_SECONDS + 6.0)
+
+    def test_concurrent_waits_queue_behind_reserved_slot(
+        self, frozen_time: list[float], sleeps: list[float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        limiter = RateLimiter(quiet=True)
+        monkeypatch.setattr(limiter, "_random_delay", lambda: 2.0)
+
+        # Clock frozen: the second caller arrives while the first still sleeps
+        limiter.wait_if_needed("www.instagram.com")
+        limiter.wait_if_needed("www.instagram.com")
+
+        assert sleeps == [2.0, 2.0, 2.0]
+
+    def test_stats_sum_hosts(self, frozen_time: list[float]) -> None:
+        limiter = RateLimiter(quiet=True)
+        limiter.record_request("a.example")
+        limiter.record_request("b.example")
+        limiter.record_request("b.example")
+
+        assert limiter.get_stats()["requests_in_window"] == 3